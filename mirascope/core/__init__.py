@@ -1,6 +1,8 @@
 """The Mirascope Core Functionality."""
 
-from contextlib import suppress
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from . import base
 from .base import (
@@ -12,38 +14,58 @@ from .base import (
     FromCallArgs,
     Messages,
     ResponseModelConfigDict,
+    cache,
     merge_decorators,
     metadata,
     prompt_template,
     toolkit_tool,
 )
 
-with suppress(ImportError):
-    from . import anthropic as anthropic
+if TYPE_CHECKING:
+    from . import (
+        anthropic,
+        azure,
+        cohere,
+        gemini,
+        groq,
+        litellm,
+        mistral,
+        openai,
+        vertex,
+    )
 
-with suppress(ImportError):
-    from . import cohere as cohere
-
-with suppress(ImportError):
-    from . import gemini as gemini
-
-with suppress(ImportError):
-    from . import groq as groq
-
-with suppress(ImportError):
-    from . import litellm as litellm
+_PROVIDERS = frozenset(
+    {
+        "anthropic",
+        "azure",
+        "cohere",
+        "gemini",
+        "groq",
+        "litellm",
+        "mistral",
+        "openai",
+        "vertex",
+    }
+)
 
-with suppress(ImportError):
-    from . import mistral as mistral
 
-with suppress(ImportError):
-    from . import openai as openai
+def __getattr__(name: str) -> ModuleType:
+    """Imports provider modules on first access so unused SDKs are never imported.
 
-with suppress(ImportError):
-    from . import vertex as vertex
+    A provider whose SDK is not installed is reported as a missing attribute, which
+    `from mirascope.core import ...` surfaces as an `ImportError`.
+    """
+    if name not in _PROVIDERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = import_module(f".{name}", __name__)
+    except ImportError as e:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} ({e})"
+        ) from e
+    globals()[name] = module
+    return module
 
-with suppress(ImportError):
-    from . import azure as azure
 
 __all__ = [
     "anthropic",
@@ -54,6 +76,7 @@ __all__ = [
     "BasePrompt",
     "BaseTool",
     "BaseToolKit",
+    "cache",
     "cohere",
     "FromCallArgs",
     "gemini",
@@ -91,7 +91,7 @@ def handle_stream(
             tool_types,
             partial_tools,
         )
-        yield AnthropicCallResponseChunk(chunk=chunk), tool
+        yield AnthropicCallResponseChunk.model_construct(chunk=chunk), tool
 
 
 async def handle_stream_async(
@@ -110,4 +110,4 @@ async def handle_stream_async(
             tool_types,
             partial_tools,
         )
-        yield AnthropicCallResponseChunk(chunk=chunk), tool
+        yield AnthropicCallResponseChunk.model_construct(chunk=chunk), tool
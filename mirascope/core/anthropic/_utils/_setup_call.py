@@ -1,8 +1,10 @@
 """This module contains the setup_call function for the Anthropic API."""
 
 import inspect
+import os
 from collections.abc import Awaitable, Callable
-from typing import Any, cast, overload
+from functools import lru_cache
+from typing import Any, overload
 
 from anthropic import (
     Anthropic,
@@ -15,7 +17,7 @@ from anthropic import (
 from anthropic.types import Message, MessageParam, MessageStreamEvent
 from pydantic import BaseModel
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseTool, _utils
 from ...base._utils import AsyncCreateFn, CreateFn
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import AnthropicCallKwargs
@@ -26,6 +28,14 @@ from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
 
+@lru_cache(maxsize=4)
+def _default_client(
+    api_key: str | None, auth_token: str | None, base_url: str | None
+) -> Anthropic:
+    """Returns a shared `Anthropic` client so that calls reuse its connection pool."""
+    return Anthropic(api_key=api_key, auth_token=auth_token, base_url=base_url)
+
+
 @overload
 def setup_call(
     *,
@@ -104,8 +114,7 @@ def setup_call(
         call_params,
         convert_common_call_params,
     )
-    call_kwargs = cast(AnthropicCallKwargs, base_call_kwargs)
-    messages = cast(list[BaseMessageParam | MessageParam], messages)
+    call_kwargs: AnthropicCallKwargs = base_call_kwargs  # pyright: ignore [reportAssignmentType]
     messages = convert_message_params(messages)
 
     if messages[0]["role"] == "system":
@@ -113,22 +122,26 @@ def setup_call(
 
     if json_mode:
         json_mode_content = _utils.json_mode_content(response_model)
-        if isinstance(messages[-1]["content"], str):
-            messages[-1]["content"] += json_mode_content
+        if isinstance(content := messages[-1]["content"], str):
+            content += json_mode_content
         else:
-            messages[-1]["content"] = list(messages[-1]["content"]) + [
-                {"type": "text", "text": json_mode_content}
-            ]
+            content = [*content, {"type": "text", "text": json_mode_content}]
+        messages[-1] = {**messages[-1], "content": content}
     elif response_model:
         assert tool_types, "At least one tool must be provided for extraction."
         call_kwargs["tool_choice"] = {"type": "tool", "name": tool_types[0]._name()}
-    call_kwargs |= {
-        "model": model,
-        "messages": messages,
-        "max_tokens": call_kwargs["max_tokens"],
-    }
+    call_kwargs["model"] = model
+    call_kwargs["messages"] = messages
 
     if client is None:
-        client = AsyncAnthropic() if inspect.iscoroutinefunction(fn) else Anthropic()
+        client = (
+            AsyncAnthropic()
+            if inspect.iscoroutinefunction(fn)
+            else _default_client(
+                api_key=os.environ.get("ANTHROPIC_API_KEY"),
+                auth_token=os.environ.get("ANTHROPIC_AUTH_TOKEN"),
+                base_url=os.environ.get("ANTHROPIC_BASE_URL"),
+            )
+        )
     create = client.messages.create
     return create, prompt_template, messages, tool_types, call_kwargs
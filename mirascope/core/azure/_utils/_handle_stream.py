@@ -84,12 +84,12 @@ def handle_stream(
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
-                    AzureCallResponseChunk(chunk=chunk),
+                    AzureCallResponseChunk.model_construct(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
                 )
                 current_tool_type = None
             else:
-                yield AzureCallResponseChunk(chunk=chunk), None
+                yield AzureCallResponseChunk.model_construct(chunk=chunk), None
         tool, current_tool_call, current_tool_type = _handle_chunk(
             chunk,
             current_tool_call,
@@ -97,7 +97,7 @@ def handle_stream(
             tool_types,
         )
         if tool is not None:
-            yield AzureCallResponseChunk(chunk=chunk), tool
+            yield AzureCallResponseChunk.model_construct(chunk=chunk), tool
 
 
 async def handle_stream_async(
@@ -114,12 +114,12 @@ async def handle_stream_async(
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
-                    AzureCallResponseChunk(chunk=chunk),
+                    AzureCallResponseChunk.model_construct(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
                 )
                 current_tool_type = None
             else:
-                yield AzureCallResponseChunk(chunk=chunk), None
+                yield AzureCallResponseChunk.model_construct(chunk=chunk), None
         tool, current_tool_call, current_tool_type = _handle_chunk(
             chunk,
             current_tool_call,
@@ -127,4 +127,4 @@ async def handle_stream_async(
             tool_types,
         )
         if tool is not None:
-            yield AzureCallResponseChunk(chunk=chunk), tool
+            yield AzureCallResponseChunk.model_construct(chunk=chunk), tool
@@ -18,7 +18,7 @@ from azure.ai.inference.models import (
 from azure.core.credentials import AzureKeyCredential
 from pydantic import BaseModel
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseTool, _utils
 from ...base._utils import (
     DEFAULT_TOOL_DOCSTRING,
     AsyncCreateFn,
@@ -111,8 +111,7 @@ def setup_call(
         call_params,
         convert_common_call_params,
     )
-    call_kwargs = cast(AzureCallKwargs, base_call_kwargs)
-    messages = cast(list[BaseMessageParam | ChatRequestMessage], messages)
+    call_kwargs: AzureCallKwargs = base_call_kwargs  # pyright: ignore [reportAssignmentType]
     messages = convert_message_params(messages)
     if json_mode:
         if response_model and response_model.model_config.get("strict", False):
@@ -128,7 +127,7 @@ def setup_call(
             )
         else:
             call_kwargs["response_format"] = ChatCompletionsResponseFormatJSON()
-            json_mode_content = _utils.json_mode_content(response_model).strip()
+            json_mode_content = _utils.json_mode_content(response_model, strip=True)
             messages.append(UserMessage(content=json_mode_content))
     elif response_model:
         assert tool_types, "At least one tool must be provided for extraction."
@@ -139,7 +138,8 @@ def setup_call(
                 UserWarning,
             )
         call_kwargs["tool_choice"] = "required"
-    call_kwargs |= {"model": model, "messages": messages}
+    call_kwargs["model"] = model
+    call_kwargs["messages"] = messages
 
     if client is None:
         endpoint = os.environ["AZURE_INFERENCE_ENDPOINT"]
@@ -3,6 +3,7 @@
 from . import _partial, _utils
 from ._call_factory import call_factory
 from ._utils import BaseType
+from .cache import CacheStore, InMemoryStore, cache
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams, CommonCallParams
 from .call_response import BaseCallResponse, transform_tool_outputs
@@ -43,13 +44,16 @@ __all__ = [
     "BaseTool",
     "BaseToolKit",
     "BaseType",
+    "cache",
     "CacheControlPart",
+    "CacheStore",
     "call_factory",
     "CommonCallParams",
     "DocumentPart",
     "FromCallArgs",
     "GenerateJsonSchemaNoTitles",
     "ImagePart",
+    "InMemoryStore",
     "merge_decorators",
     "metadata",
     "Messages",
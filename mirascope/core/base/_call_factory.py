@@ -172,13 +172,20 @@ def call_factory(  # noqa: ANN202
     ):
         if stream and output_parser:
             raise ValueError("Cannot use `output_parser` with `stream=True`.")
+        if isinstance(stream, dict) and "batch_size" in stream:
+            if not response_model:
+                raise ValueError(
+                    "The stream `batch_size` can only be used with `response_model`."
+                )
+            if stream["batch_size"] < 1:
+                raise ValueError("The stream `batch_size` must be at least 1.")
 
         if call_params is None:
             call_params = default_call_params
 
         if response_model:
             if stream:
-                return partial(
+                llm_decorator = partial(
                     structured_stream_factory(
                         TCallResponse=TCallResponse,
                         TCallResponseChunk=TCallResponseChunk,
@@ -192,9 +199,12 @@ def call_factory(  # noqa: ANN202
                     json_mode=json_mode,
                     client=client,
                     call_params=call_params,
-                )  # pyright: ignore [reportReturnType, reportCallIssue]
+                    batch_size=stream.get("batch_size", 1)
+                    if isinstance(stream, dict)
+                    else 1,
+                )  # pyright: ignore [reportCallIssue]
             elif tools:
-                return partial(
+                llm_decorator = partial(
                     extract_with_tools_factory(
                         TCallResponse=TCallResponse,
                         setup_call=setup_call,
@@ -206,9 +216,9 @@ def call_factory(  # noqa: ANN202
                     output_parser=output_parser,
                     client=client,
                     call_params=call_params,
-                )  # pyright: ignore [reportReturnType, reportCallIssue]
+                )  # pyright: ignore [reportCallIssue]
             else:
-                return partial(
+                llm_decorator = partial(
                     extract_factory(
                         TCallResponse=TCallResponse,
                         TToolType=TToolType,
@@ -223,8 +233,8 @@ def call_factory(  # noqa: ANN202
                     call_params=call_params,
                 )  # pyright: ignore [reportCallIssue]
 
-        if stream:
-            return partial(
+        elif stream:
+            llm_decorator = partial(
                 stream_factory(
                     TCallResponse=TCallResponse,
                     TStream=TStream,
@@ -238,16 +248,33 @@ def call_factory(  # noqa: ANN202
                 client=client,
                 call_params=call_params,
                 partial_tools=isinstance(stream, dict) and stream.get("partial_tools"),
-            )  # pyright: ignore [reportReturnType, reportCallIssue]
-        return partial(
-            create_factory(TCallResponse=TCallResponse, setup_call=setup_call),
-            model=model,
-            tools=tools,
-            response_model=None,
-            output_parser=output_parser,
-            json_mode=json_mode,
-            client=client,
-            call_params=call_params,
-        )  # pyright: ignore [reportReturnType, reportCallIssue]
+            )  # pyright: ignore [reportCallIssue]
+        else:
+            llm_decorator = partial(
+                create_factory(TCallResponse=TCallResponse, setup_call=setup_call),
+                model=model,
+                tools=tools,
+                response_model=None,
+                output_parser=output_parser,
+                json_mode=json_mode,
+                client=client,
+                call_params=call_params,
+            )  # pyright: ignore [reportCallIssue]
+
+        def decorator(fn: Callable) -> Callable:
+            llm_fn = llm_decorator(fn)
+            llm_fn._call_config = {  # pyright: ignore [reportFunctionMemberAccess]
+                "provider": TCallResponse._provider,
+                "model": model,
+                "tools": tools,
+                "response_model": response_model,
+                "output_parser": output_parser,
+                "json_mode": json_mode,
+                "client": client,
+                "call_params": call_params,
+            }
+            return llm_fn
+
+        return decorator  # pyright: ignore [reportReturnType]
 
     return base_call  # pyright: ignore [reportReturnType]
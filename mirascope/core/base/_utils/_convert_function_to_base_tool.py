@@ -1,10 +1,11 @@
 import inspect
 from abc import update_abstractmethods
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, TypeVar, cast, get_type_hints
 
 import jiter
-from docstring_parser import parse
+from docstring_parser import Docstring, parse
 from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
@@ -13,6 +14,11 @@ from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
 
+@lru_cache(maxsize=256)
+def _parse_docstring(doc: str) -> Docstring:
+    return parse(doc)
+
+
 def convert_function_to_base_tool(
     fn: Callable,
     base: type[BaseToolT],
@@ -44,7 +50,7 @@ def convert_function_to_base_tool(
     docstring, examples = None, []
     func_doc = __doc__ or fn.__doc__
     if func_doc:
-        docstring = parse(func_doc)
+        docstring = _parse_docstring(func_doc)
         for example in docstring.examples or []:
             if example.description:
                 examples.append(jiter.from_json(example.description.encode()))
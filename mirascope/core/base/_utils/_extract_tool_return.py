@@ -21,6 +21,16 @@ def extract_tool_return(
     allow_partial: bool,
     fields_from_call_args: dict[str, Any],
 ) -> _ResponseModelT:
+    if isinstance(json_output, str) and not allow_partial:
+        # Validate directly from the JSON string in a single pass when we don't need
+        # to inspect or update the parsed object first. Malformed JSON then raises a
+        # `ValidationError` (still a `ValueError`), and strict models validate in JSON
+        # mode, so e.g. ISO date strings are accepted for `date` fields.
+        if is_base_type(response_model):
+            temp_model = convert_base_type_to_base_tool(response_model, BaseModel)
+            return temp_model.model_validate_json(json_output).value  # pyright: ignore [reportAttributeAccessIssue]
+        if not fields_from_call_args:
+            return response_model.model_validate_json(json_output)
     json_obj = (
         jiter.from_json(
             json_output.encode(),
@@ -12,11 +12,9 @@ from collections.abc import (
 )
 from typing import (
     Any,
-    Literal,
     TypeAlias,
     TypeVar,
     cast,
-    overload,
 )
 
 from typing_extensions import TypeIs
@@ -52,20 +50,6 @@ def get_async_create_fn(
     async_func: _AsyncFunc[_NonStreamedResponse],
     async_generator_func: _AsyncGeneratorFunc[_StreamedResponse] | None = None,
 ) -> AsyncCreateFn[_NonStreamedResponse, _StreamedResponse]:
-    @overload
-    def create_or_stream(
-        *,
-        stream: Literal[True] | StreamConfig = True,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> Awaitable[AsyncGenerator[_StreamedResponse, None]]: ...
-
-    @overload
-    def create_or_stream(
-        *,
-        stream: Literal[False] = False,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> Awaitable[_NonStreamedResponse]: ...
-
     def create_or_stream(
         *,
         stream: bool | StreamConfig = False,
@@ -92,27 +76,13 @@ def get_async_create_fn(
                     Awaitable[AsyncGenerator[_StreamedResponse]], async_generator
                 )
 
-    return create_or_stream
+    return create_or_stream  # pyright: ignore [reportReturnType]
 
 
 def get_create_fn(
     sync_func: _SyncFunc[_NonStreamedResponse],
     sync_generator_func: _SyncGeneratorFunc[_StreamedResponse] | None = None,
 ) -> CreateFn[_NonStreamedResponse, _StreamedResponse]:
-    @overload
-    def create_or_stream(
-        *,
-        stream: Literal[True] | StreamConfig = True,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> Generator[_StreamedResponse, None, None]: ...
-
-    @overload
-    def create_or_stream(
-        *,
-        stream: Literal[False] = False,
-        **kwargs: Any,  # noqa: ANN401
-    ) -> _NonStreamedResponse: ...
-
     def create_or_stream(
         *,
         stream: bool | StreamConfig = False,
@@ -134,4 +104,4 @@ def get_create_fn(
 
         return cast(_NonStreamedResponse, sync_func(**kwargs))
 
-    return create_or_stream
+    return create_or_stream  # pyright: ignore [reportReturnType]
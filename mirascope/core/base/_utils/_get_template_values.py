@@ -1,10 +1,11 @@
 """This module contains the `get_template_values` function."""
 
+from collections.abc import Sequence
 from typing import Any
 
 
 def get_template_values(
-    template_variables: list[tuple[str, str | None]], attrs: dict[str, Any]
+    template_variables: Sequence[tuple[str, str | None]], attrs: dict[str, Any]
 ) -> dict[str, Any]:
     """Returns the values of the given `template_variables` from the provided `attrs`.
 
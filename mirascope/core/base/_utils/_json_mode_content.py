@@ -1,14 +1,24 @@
 """A function generating content to request JSON mode from models without it."""
 
 import json
+from functools import lru_cache
 
 from pydantic import BaseModel
 
 from ..tool import GenerateJsonSchemaNoTitles
 
 
-def json_mode_content(tool_type: type[BaseModel] | None) -> str:
-    """Returns the content to request JSON mode from models without it."""
+@lru_cache(maxsize=128)
+def json_mode_content(tool_type: type[BaseModel] | None, strip: bool = False) -> str:
+    """Returns the content to request JSON mode from models without it.
+
+    The content only depends on the tool type's schema, so it is cached per type to
+    avoid regenerating the schema on every call. By default the content starts with
+    newlines so it can be appended to an existing message. Set `strip=True` for
+    content to use as a message of its own.
+    """
+    if strip:
+        return json_mode_content(tool_type).strip()
     if not tool_type:
         return "\n\nFor your final response, output ONLY a valid JSON dict that adheres to the schema"
     return f"""
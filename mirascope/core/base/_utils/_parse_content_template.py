@@ -2,6 +2,7 @@
 
 import re
 import urllib.request
+from functools import lru_cache
 from typing import Any, Literal, cast
 
 from typing_extensions import TypedDict
@@ -32,7 +33,8 @@ class _Part(TypedDict):
     options: dict[str, str] | None
 
 
-def _parse_parts(template: str) -> list[_Part]:
+@lru_cache(maxsize=1024)
+def _parse_parts(template: str) -> tuple[_Part, ...]:
     # \{ and \} match the literal curly braces.
     #
     # ([^:{}]*) captures content before the colon that are not { or } or :.
@@ -64,7 +66,7 @@ def _parse_parts(template: str) -> list[_Part]:
                     template=special_content, type=special_type, options=special_options
                 )
             )
-    return parts
+    return tuple(parts)
 
 
 def _load_media(source: str | bytes) -> bytes:
@@ -219,6 +221,7 @@ def parse_content_template(
     if not parts:
         return None
 
+    # The parts were validated on construction, so we can skip re-validating them.
     if len(parts) == 1 and parts[0].type == "text":
-        return BaseMessageParam(role=role, content=parts[0].text)
-    return BaseMessageParam(role=role, content=parts)
+        return BaseMessageParam.model_construct(role=role, content=parts[0].text)
+    return BaseMessageParam.model_construct(role=role, content=parts)
@@ -1,6 +1,7 @@
 """This module provides a function to parse messages from a prompt template."""
 
 import re
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
@@ -17,6 +18,17 @@ _CallParamsT = TypeVar("_CallParamsT", bound=BaseCallParams)
 _ClientT = TypeVar("_ClientT")
 
 
+@lru_cache(maxsize=1024)
+def _split_role_templates(re_roles: str, template: str) -> tuple[tuple[str, str], ...]:
+    """Returns the `(role, content_template)` pairs, cached per template string."""
+    return tuple(
+        (match.group(1).lower(), match.group(2).strip())
+        for match in re.finditer(
+            rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template
+        )
+    )
+
+
 def parse_prompt_messages(
     roles: list[str],
     template: str,
@@ -34,8 +46,7 @@ def parse_prompt_messages(
             attrs |= computed_fields
     messages = []
     re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
-    for match in re.finditer(rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template):
-        role, content_template = match.group(1).lower(), match.group(2).strip()
+    for role, content_template in _split_role_templates(re_roles, template):
         if role == "messages":
             template_variables = get_template_variables(content_template, False)
             if template_variables[0].startswith("self"):
@@ -6,6 +6,7 @@ from collections.abc import (
     Callable,
     Sequence,
 )
+from functools import lru_cache
 from typing import Any, Protocol, TypeVar, cast
 
 from ..call_kwargs import BaseCallKwargs
@@ -27,6 +28,40 @@ class ConvertCommonParamsFunc(Protocol[_BaseCallParamsT]):
     def __call__(self, common_params: CommonCallParams) -> _BaseCallParamsT: ...
 
 
+@lru_cache(maxsize=256)
+def _convert_common_call_params_cached(
+    convert_common_call_params: ConvertCommonParamsFunc[_BaseCallParamsT],
+    common_params_items: frozenset[tuple[str, Any]],
+) -> _BaseCallParamsT:
+    return convert_common_call_params(cast(CommonCallParams, dict(common_params_items)))
+
+
+def _convert_common_call_params(
+    convert_common_call_params: ConvertCommonParamsFunc[_BaseCallParamsT],
+    common_params: CommonCallParams,
+) -> _BaseCallParamsT:
+    """Converts the common params, reusing the result for identical hashable params."""
+    try:
+        common_params_items = frozenset(common_params.items())
+    except TypeError:  # unhashable values such as a list of `stop` sequences
+        return convert_common_call_params(common_params)
+    return _convert_common_call_params_cached(
+        convert_common_call_params, common_params_items
+    )
+
+
+@lru_cache(maxsize=256)
+def _convert_tool(
+    tool: type[BaseTool] | Callable, tool_type: type[_BaseToolT]
+) -> type[_BaseToolT]:
+    """Converts the tool, reusing the constructed type for previously seen tools."""
+    return (
+        convert_base_model_to_base_tool(tool, tool_type)
+        if inspect.isclass(tool)
+        else convert_function_to_base_tool(tool, tool_type)
+    )
+
+
 def setup_call(
     fn: Callable[..., _BaseDynamicConfigT | Awaitable[_BaseDynamicConfigT]]
     | Callable[..., Sequence[BaseMessageParam]]
@@ -44,8 +79,10 @@ def setup_call(
     BaseCallKwargs,
 ]:
     if isinstance(call_params, dict) and call_params.keys() <= _CALL_PARAMS_KEYS:
-        call_params = convert_common_call_params(cast(CommonCallParams, call_params))
-    call_kwargs = cast(BaseCallKwargs[_BaseToolT], dict(call_params))
+        call_params = _convert_common_call_params(
+            convert_common_call_params, cast(CommonCallParams, call_params)
+        )
+    call_kwargs: BaseCallKwargs[_BaseToolT] = dict(call_params)  # pyright: ignore [reportAssignmentType]
     prompt_template, messages = None, None
     if dynamic_config is not None:
         tools = dynamic_config.get("tools", tools)
@@ -68,12 +105,7 @@ def setup_call(
 
     tool_types = None
     if tools:
-        tool_types = [
-            convert_base_model_to_base_tool(tool, tool_type)
-            if inspect.isclass(tool)
-            else convert_function_to_base_tool(tool, tool_type)
-            for tool in tools
-        ]
+        tool_types = [_convert_tool(tool, tool_type) for tool in tools]
         call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
 
     return prompt_template, messages, tool_types, call_kwargs
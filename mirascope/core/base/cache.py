@@ -0,0 +1,212 @@
+"""The `cache` decorator for reusing the outputs of identical LLM calls."""
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from types import FunctionType
+from typing import Any, Protocol, TypeVar, get_origin
+
+from pydantic_core import PydanticSerializationError, to_json
+
+from ._utils import fn_is_async, get_fn_args
+from .stream import BaseStream
+from .structured_stream import BaseStructuredStream
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class CacheStore(Protocol):
+    """The interface a store must implement to be used with `cache`."""
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """Returns the value stored under `key` or `None` if there is no such value."""
+        ...
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Stores `value` under `key`."""
+        ...
+
+
+class InMemoryStore:
+    """A `CacheStore` that keeps the most recently used values in memory.
+
+    This store is not thread-safe. Use a store that handles its own locking if the
+    cached call is made from multiple threads.
+
+    Args:
+        maxsize: The maximum number of values to keep. Once full, the least recently
+            used value is evicted.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._values: OrderedDict[str, Any] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """Returns the value stored under `key` or `None` if there is no such value."""
+        if key not in self._values:
+            return None
+        self._values.move_to_end(key)
+        return self._values[key]
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Stores `value` under `key`, evicting the least recently used value if full."""
+        self._values[key] = value
+        self._values.move_to_end(key)
+        if len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+
+
+def _qualified_name(value: object) -> object:
+    """Returns a stable identifier for a class or function in a call's configuration.
+
+    Classes and named functions are identified by their qualified name and generic
+    aliases (e.g. `list[str]`) by their `repr`. Anything else (e.g. a lambda) is
+    returned as is, so it fails to serialize and the call is not cached.
+    """
+    if isinstance(value, type) or (
+        isinstance(value, FunctionType) and value.__name__ != "<lambda>"
+    ):
+        return f"{value.__module__}.{value.__qualname__}"
+    if get_origin(value) is not None:
+        return repr(value)
+    return value
+
+
+def _client_key(client: object) -> dict[str, Any] | None:
+    """Returns the type and base URL that identify the endpoint a client calls."""
+    if client is None:
+        return None
+    base_url = getattr(client, "base_url", None)
+    return {
+        "type": _qualified_name(type(client)),
+        "base_url": None if base_url is None else str(base_url),
+    }
+
+
+def _call_config_key(fn: Callable) -> dict[str, Any] | None:
+    """Returns the serializable configuration of a provider call, if `fn` is one.
+
+    Provider call decorators record their provider, model, tools, response model,
+    output parser, JSON mode, client, and call params on the decorated function.
+    Different calls built from the same prompt function share a module and qualified
+    name, so the configuration is what tells them apart.
+    """
+    call_config = getattr(fn, "_call_config", None)
+    if call_config is None:
+        return None
+    return call_config | {
+        "tools": [_qualified_name(tool) for tool in call_config["tools"] or []],
+        "response_model": _qualified_name(call_config["response_model"]),
+        "output_parser": _qualified_name(call_config["output_parser"]),
+        "client": _client_key(call_config["client"]),
+    }
+
+
+def _cache_key(
+    fn: Callable, args: tuple[object, ...], kwargs: dict[str, Any]
+) -> str | None:
+    """Returns a stable key for calling `fn` with the given arguments.
+
+    The decorated call's module and qualified name identify the prompt, its call
+    configuration identifies the provider call, and the bound arguments identify the
+    inputs. Returns `None` if any of these cannot be serialized, since there is then
+    no stable way to tell the inputs apart (e.g. a default `repr` is just a memory
+    address that a different object can later reuse).
+    """
+    try:
+        key_json = to_json(
+            [
+                fn.__module__,
+                fn.__qualname__,
+                _call_config_key(fn),
+                get_fn_args(fn, args, kwargs),
+            ]
+        )
+    except PydanticSerializationError:
+        return None
+    return hashlib.blake2b(key_json, digest_size=16).hexdigest()
+
+
+def _is_cacheable(output: object) -> bool:
+    """Returns whether `output` can be returned again, which excludes streams."""
+    return output is not None and not isinstance(
+        output, BaseStream | BaseStructuredStream
+    )
+
+
+def cache(store: CacheStore | None = None) -> Callable[[_F], _F]:
+    """Returns a decorator that reuses the output of identical calls.
+
+    The decorated call is only run when it has not previously been called with the
+    same arguments. Otherwise, the stored output (e.g. the call response or extracted
+    response model) is returned without making an API request. This is only useful
+    for deterministic calls (e.g. `temperature=0`) where the same prompt should always
+    produce the same output. Streams are never cached, and neither are calls whose
+    arguments or call params cannot be serialized to JSON.
+
+    The key includes the type and base URL of the `client` passed to the call
+    decorator, so calls to different endpoints can share a store. A client provided
+    through dynamic configuration is not part of the key, so don't share a store
+    between calls that differ only in such a client.
+
+    Example:
+
+    ```python
+    from mirascope.core import cache, openai
+
+
+    @cache()
+    @openai.call("gpt-4o-mini", call_params={"temperature": 0})
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    response = recommend_book("fantasy")  # makes the API call
+    response = recommend_book("fantasy")  # returns the cached response
+    ```
+
+    Args:
+        store: The store in which to keep the outputs. Defaults to a new
+            `InMemoryStore` for each decorated call.
+
+    Returns:
+        The decorator for caching the outputs of the decorated call.
+    """
+
+    def decorator(fn: _F) -> _F:
+        cache_store = store if store is not None else InMemoryStore()
+
+        if fn_is_async(fn):
+
+            @wraps(fn)
+            async def inner_async(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                key = _cache_key(fn, args, kwargs)
+                if key is None:
+                    return await fn(*args, **kwargs)
+                if (output := cache_store.get(key)) is not None:
+                    return output
+                output = await fn(*args, **kwargs)
+                if _is_cacheable(output):
+                    cache_store.set(key, output)
+                return output
+
+            return inner_async  # pyright: ignore [reportReturnType]
+        else:
+
+            @wraps(fn)
+            def inner(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                key = _cache_key(fn, args, kwargs)
+                if key is None:
+                    return fn(*args, **kwargs)
+                if (output := cache_store.get(key)) is not None:
+                    return output
+                output = fn(*args, **kwargs)
+                if _is_cacheable(output):
+                    cache_store.set(key, output)
+                return output
+
+            return inner  # pyright: ignore [reportReturnType]
+
+    return decorator
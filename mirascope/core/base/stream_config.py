@@ -1,11 +1,17 @@
 from typing import TypedDict
 
+from typing_extensions import NotRequired
+
 
 class StreamConfig(TypedDict):
     """Configuration options for streaming.
 
     Attributes:
         partial_tools (bool): Whether to stream partial tool responses
+        batch_size (int): The number of chunks to accumulate before validating and
+            yielding each partial response model when streaming structured outputs.
+            Only valid with a `response_model`
     """
 
     partial_tools: bool
+    batch_size: NotRequired[int]
@@ -62,16 +62,22 @@ class BaseStructuredStream(Generic[_ResponseModelT]):
         stream: BaseStream,
         response_model: type[_ResponseModelT],
         fields_from_call_args: dict[str, Any],
+        batch_size: int = 1,
     ) -> None:
-        """Initializes an instance of `BaseStructuredStream`."""
+        """Initializes an instance of `BaseStructuredStream`.
+
+        Partial response models are only validated and yielded every `batch_size`
+        chunks since validating the partial JSON on every chunk is expensive.
+        """
         self.stream = stream
         self.response_model = response_model
         self.fields_from_call_args = fields_from_call_args
+        self.batch_size = batch_size
 
     def __iter__(self) -> Generator[_ResponseModelT, None, None]:
         """Iterates over the stream and extracts structured outputs."""
         json_output = ""
-        for chunk, _ in self.stream:
+        for i, (chunk, _) in enumerate(self.stream, start=1):
             json_output += chunk.content
             if json_output and json_output[0] != "{":
                 try:
@@ -81,7 +87,7 @@ class BaseStructuredStream(Generic[_ResponseModelT]):
                     json_output = ""
             if chunk.model is not None:
                 self.stream.model = chunk.model
-            if json_output:
+            if json_output and i % self.batch_size == 0:
                 yield extract_tool_return(
                     self.response_model, json_output, True, self.fields_from_call_args
                 )
@@ -97,7 +103,9 @@ class BaseStructuredStream(Generic[_ResponseModelT]):
 
         async def generator() -> AsyncGenerator[_ResponseModelT, None]:
             json_output = ""
+            i = 0
             async for chunk, _ in self.stream:
+                i += 1
                 json_output += chunk.content
                 if json_output and json_output[0] != "{":
                     try:
@@ -107,7 +115,7 @@ class BaseStructuredStream(Generic[_ResponseModelT]):
                         json_output = ""
                 if chunk.model is not None:
                     self.stream.model = chunk.model
-                if json_output:
+                if json_output and i % self.batch_size == 0:
                     yield extract_tool_return(
                         self.response_model,
                         json_output,
@@ -208,6 +216,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        batch_size: int = 1,
     ) -> Callable[
         _P,
         Iterable[_ResponseModelT] | Awaitable[AsyncIterable[_ResponseModelT]],
@@ -273,6 +282,7 @@ def structured_stream_factory(  # noqa: ANN201
                     ),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
+                    batch_size=batch_size,
                 )
 
             return inner_async
@@ -289,6 +299,7 @@ def structured_stream_factory(  # noqa: ANN201
                     ),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
+                    batch_size=batch_size,
                 )
 
             return inner
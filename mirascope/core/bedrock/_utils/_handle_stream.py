@@ -1,8 +1,8 @@
 """Handles the stream of completion chunks."""
 
-import json
 from collections.abc import AsyncGenerator, Generator
 
+import jiter
 from mypy_boto3_bedrock_runtime.type_defs import (
     ToolUseBlockOutputTypeDef,
 )
@@ -35,7 +35,7 @@ def _handle_chunk(
 ]:
     """Handles a chunk of the stream."""
     if not tool_types:
-        return BedrockCallResponseChunk(chunk=chunk), None, None
+        return BedrockCallResponseChunk.model_construct(chunk=chunk), None, None
     elif (content_block_start := chunk.get("contentBlockStart")) and (
         tool_use := content_block_start["start"].get("toolUse")
     ):
@@ -62,16 +62,22 @@ def _handle_chunk(
                 current_tool_use = ToolUseBlockContentTypeDef(
                     toolUse=ToolUseBlockOutputTypeDef(
                         toolUseId=current_tool_use_chunk["tool_use_id"],
-                        input=json.loads(current_tool_use_chunk["input_chunk"]),
+                        input=jiter.from_json(
+                            current_tool_use_chunk["input_chunk"].encode()
+                        ),
                         name=current_tool_use_chunk["name"],
                     )
                 )
                 return (
-                    BedrockCallResponseChunk(chunk=chunk),
+                    BedrockCallResponseChunk.model_construct(chunk=chunk),
                     tool_type.from_tool_call(current_tool_use),
                     None,
                 )
-    return BedrockCallResponseChunk(chunk=chunk), None, current_tool_use_chunk
+    return (
+        BedrockCallResponseChunk.model_construct(chunk=chunk),
+        None,
+        current_tool_use_chunk,
+    )
 
 
 def handle_stream(
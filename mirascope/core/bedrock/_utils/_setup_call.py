@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, ParamSpec, cast, overload
 
 from aiobotocore.session import AioSession, get_session
@@ -27,7 +27,6 @@ from types_aiobotocore_bedrock_runtime.type_defs import (
     ConverseStreamResponseTypeDef as AsyncConverseStreamResponseTypeDef,
 )
 
-from ... import BaseMessageParam
 from ...base import BaseTool, _utils
 from ...base._utils import (
     AsyncCreateFn,
@@ -91,6 +90,12 @@ async def _get_async_client(session: AioSession) -> AsyncBedrockRuntimeClient:
         return client
 
 
+@lru_cache(maxsize=1)
+def _default_client() -> BedrockRuntimeClient:
+    """Returns a shared Bedrock client since creating one is expensive."""
+    return Session().client("bedrock-runtime")
+
+
 @overload
 def setup_call(
     *,
@@ -165,8 +170,7 @@ def setup_call(
         call_params,
         convert_common_call_params,
     )
-    call_kwargs = cast(BedrockCallKwargs, base_call_kwargs)
-    messages = cast(list[InternalBedrockMessageParam | BaseMessageParam], messages)
+    call_kwargs: BedrockCallKwargs = base_call_kwargs  # pyright: ignore [reportAssignmentType]
     messages = convert_message_params(messages)
     if messages[0]["role"] == "system":
         call_kwargs["system"] = [
@@ -181,13 +185,16 @@ def setup_call(
         )
     if json_mode:
         json_mode_content = _utils.json_mode_content(response_model)
-        if "text" in messages[-1]["content"][-1]:
-            messages[-1]["content"][-1]["text"] += json_mode_content
+        last_message = messages[-1]
+        content = list(last_message["content"])
+        last_block = content.pop()
+        if "text" in last_block:
+            content.append({"text": last_block["text"] + json_mode_content})
         else:
-            messages[-1]["content"] = [
-                *messages[-1]["content"],
-                {"text": json_mode_content},
-            ]
+            content += [last_block, {"text": json_mode_content}]
+        messages[-1] = cast(
+            InternalBedrockMessageParam, {**last_message, "content": content}
+        )
     elif response_model:
         assert tool_types, "At least one tool must be provided for extraction."
         if "toolConfig" in call_kwargs:
@@ -195,15 +202,15 @@ def setup_call(
                 ToolChoiceTypeDef, {"type": "tool", "name": tool_types[0]._name()}
             )
 
-    call_kwargs |= cast(BedrockCallKwargs, {"modelId": model, "messages": messages})
+    call_kwargs["modelId"] = model
+    call_kwargs["messages"] = messages
 
     if client is None:
         if fn_is_async(fn):
             session = get_session()
             client = asyncio.run(_get_async_client(session))
         else:
-            session = Session()
-            client = session.client("bedrock-runtime")
+            client = _default_client()
 
     create = (
         get_async_create_fn(
@@ -18,7 +18,7 @@ def handle_stream(
     Note: cohere does not currently support streaming tools.
     """
     for chunk in stream:
-        yield CohereCallResponseChunk(chunk=chunk), None
+        yield CohereCallResponseChunk.model_construct(chunk=chunk), None
 
 
 async def handle_stream_async(
@@ -32,4 +32,4 @@ async def handle_stream_async(
     Note: cohere does not currently support streaming tools.
     """
     async for chunk in stream:
-        yield CohereCallResponseChunk(chunk=chunk), None
+        yield CohereCallResponseChunk.model_construct(chunk=chunk), None
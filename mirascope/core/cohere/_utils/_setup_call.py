@@ -7,7 +7,6 @@ from collections.abc import (
 )
 from typing import (
     Any,
-    cast,
     overload,
 )
 
@@ -19,7 +18,7 @@ from cohere import (
 from cohere.types import ChatMessage, StreamedChatResponse
 from pydantic import BaseModel
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseTool, _utils
 from ...base._utils import (
     AsyncCreateFn,
     CreateFn,
@@ -100,7 +99,7 @@ def setup_call(
     list[type[CohereTool]] | None,
     CohereCallKwargs,
 ]:
-    prompt_template, messages, tool_types, call_kwargs = _utils.setup_call(
+    prompt_template, messages, tool_types, base_call_kwargs = _utils.setup_call(
         fn,
         fn_args,
         dynamic_config,
@@ -109,8 +108,7 @@ def setup_call(
         call_params,
         convert_common_call_params,
     )
-    call_kwargs = cast(CohereCallKwargs, call_kwargs)
-    messages = cast(list[BaseMessageParam | ChatMessage], messages)
+    call_kwargs: CohereCallKwargs = base_call_kwargs  # pyright: ignore [reportAssignmentType]
     messages = convert_message_params(messages)
 
     preamble = ""
@@ -133,10 +131,8 @@ def setup_call(
         )
     elif response_model:
         assert tool_types, "At least one tool must be provided for extraction."
-    call_kwargs |= {
-        "model": model,
-        "message": messages[-1].message,
-    }
+    call_kwargs["model"] = model
+    call_kwargs["message"] = messages[-1].message
 
     if client is None:
         client = AsyncClient() if inspect.iscoroutinefunction(fn) else Client()
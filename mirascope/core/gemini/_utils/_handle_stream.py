@@ -17,7 +17,7 @@ def handle_stream(
     Note: gemini does not currently support streaming tools.
     """
     for chunk in stream:
-        yield GeminiCallResponseChunk(chunk=chunk), None
+        yield GeminiCallResponseChunk.model_construct(chunk=chunk), None
 
 
 async def handle_stream_async(
@@ -30,4 +30,4 @@ async def handle_stream_async(
     Note: gemini does not currently support streaming tools.
     """
     async for chunk in stream:
-        yield GeminiCallResponseChunk(chunk=chunk), None
+        yield GeminiCallResponseChunk.model_construct(chunk=chunk), None
@@ -14,7 +14,7 @@ from google.generativeai.types import (
 from google.generativeai.types.content_types import ToolConfigDict
 from pydantic import BaseModel
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseTool, _utils
 from ...base._utils import (
     AsyncCreateFn,
     CreateFn,
@@ -105,17 +105,21 @@ def setup_call(
         call_params,
         convert_common_call_params,
     )
-    call_kwargs = cast(GeminiCallKwargs, base_call_kwargs)
-    messages = cast(list[BaseMessageParam | ContentDict], messages)
+    call_kwargs: GeminiCallKwargs = base_call_kwargs  # pyright: ignore [reportAssignmentType]
     messages = convert_message_params(messages)
     if json_mode:
         generation_config = call_kwargs.get("generation_config", {})
         if is_dataclass(generation_config):
             generation_config = asdict(generation_config)
+        else:
+            generation_config = dict(generation_config)
         if not tools:
             generation_config["response_mime_type"] = "application/json"
         call_kwargs["generation_config"] = cast(GenerationConfigDict, generation_config)
-        messages[-1]["parts"].append(_utils.json_mode_content(response_model))
+        messages[-1] = {
+            **messages[-1],
+            "parts": [*messages[-1]["parts"], _utils.json_mode_content(response_model)],
+        }
     elif response_model:
         assert tool_types, "At least one tool must be provided for extraction."
         call_kwargs.pop("tool_config", None)
@@ -125,7 +129,7 @@ def setup_call(
             "allowed_function_names": [tool_types[0]._name()],
         }
         call_kwargs["tool_config"] = tool_config
-    call_kwargs |= {"contents": messages}
+    call_kwargs["contents"] = messages
 
     if client is None:
         client = GenerativeModel(model_name=model)
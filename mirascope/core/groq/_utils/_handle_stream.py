@@ -77,12 +77,12 @@ def handle_stream(
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
-                    GroqCallResponseChunk(chunk=chunk),
+                    GroqCallResponseChunk.model_construct(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
                 )
                 current_tool_type = None
             else:
-                yield GroqCallResponseChunk(chunk=chunk), None
+                yield GroqCallResponseChunk.model_construct(chunk=chunk), None
         tool, current_tool_call, current_tool_type = _handle_chunk(
             chunk,
             current_tool_call,
@@ -90,7 +90,7 @@ def handle_stream(
             tool_types,
         )
         if tool is not None:
-            yield GroqCallResponseChunk(chunk=chunk), tool
+            yield GroqCallResponseChunk.model_construct(chunk=chunk), tool
 
 
 async def handle_stream_async(
@@ -107,12 +107,12 @@ async def handle_stream_async(
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
-                    GroqCallResponseChunk(chunk=chunk),
+                    GroqCallResponseChunk.model_construct(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
                 )
                 current_tool_type = None
             else:
-                yield GroqCallResponseChunk(chunk=chunk), None
+                yield GroqCallResponseChunk.model_construct(chunk=chunk), None
         tool, current_tool_call, current_tool_type = _handle_chunk(
             chunk,
             current_tool_call,
@@ -120,4 +120,4 @@ async def handle_stream_async(
             tool_types,
         )
         if tool is not None:
-            yield GroqCallResponseChunk(chunk=chunk), tool
+            yield GroqCallResponseChunk.model_construct(chunk=chunk), tool
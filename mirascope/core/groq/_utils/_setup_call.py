@@ -1,8 +1,10 @@
 """This module contains the setup_call function for Groq tools."""
 
 import inspect
+import os
 from collections.abc import Awaitable, Callable
-from typing import Any, cast, overload
+from functools import lru_cache
+from typing import Any, overload
 
 from groq import AsyncGroq, Groq
 from groq.types.chat import (
@@ -12,7 +14,7 @@ from groq.types.chat import (
 )
 from pydantic import BaseModel
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseTool, _utils
 from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
 from ...base.call_params import CommonCallParams
 from ...base.stream_config import StreamConfig
@@ -24,6 +26,12 @@ from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
 
+@lru_cache(maxsize=4)
+def _default_client(api_key: str | None, base_url: str | None) -> Groq:
+    """Returns a shared `Groq` client so that calls reuse its connection pool."""
+    return Groq(api_key=api_key, base_url=base_url)
+
+
 @overload
 def setup_call(
     *,
@@ -97,32 +105,52 @@ def setup_call(
         call_params,
         convert_common_call_params,
     )
-    call_kwargs = cast(GroqCallKwargs, base_call_kwargs)
-    messages = cast(list[BaseMessageParam | ChatCompletionMessageParam], messages)
+    call_kwargs: GroqCallKwargs = base_call_kwargs  # pyright: ignore [reportAssignmentType]
     messages = convert_message_params(messages)
     if json_mode:
         if not tools:
             call_kwargs["response_format"] = {"type": "json_object"}
-        json_mode_content = _utils.json_mode_content(response_model)
-        if messages[-1]["role"] == "user":
-            if isinstance(messages[-1]["content"], str):
-                messages[-1]["content"] += json_mode_content
-            else:
-                messages[-1]["content"] = list(messages[-1]["content"]) + [
-                    {"type": "text", "text": json_mode_content.strip()}
-                ]
+        if (last_message := messages[-1])["role"] != "user":
+            messages.append(
+                {
+                    "role": "user",
+                    "content": _utils.json_mode_content(response_model, strip=True),
+                }
+            )
+        elif isinstance(content := last_message["content"], str):
+            messages[-1] = {
+                **last_message,
+                "content": content + _utils.json_mode_content(response_model),
+            }
         else:
-            messages.append({"role": "user", "content": json_mode_content.strip()})
+            messages[-1] = {
+                **last_message,
+                "content": [
+                    *content,
+                    {
+                        "type": "text",
+                        "text": _utils.json_mode_content(response_model, strip=True),
+                    },
+                ],
+            }
     elif response_model:
         assert tool_types, "At least one tool must be provided for extraction."
         call_kwargs["tool_choice"] = {
             "type": "function",
             "function": {"name": tool_types[0]._name()},
         }
-    call_kwargs |= {"model": model, "messages": messages}
+    call_kwargs["model"] = model
+    call_kwargs["messages"] = messages
 
     if client is None:
-        client = AsyncGroq() if inspect.iscoroutinefunction(fn) else Groq()
+        client = (
+            AsyncGroq()
+            if inspect.iscoroutinefunction(fn)
+            else _default_client(
+                api_key=os.environ.get("GROQ_API_KEY"),
+                base_url=os.environ.get("GROQ_BASE_URL"),
+            )
+        )
 
     create = (
         get_async_create_fn(client.chat.completions.create)
@@ -35,12 +35,22 @@ def convert_message_params(
         BaseMessageParam | AssistantMessage | SystemMessage | ToolMessage | UserMessage
     ],
 ) -> list[AssistantMessage | SystemMessage | ToolMessage | UserMessage]:
+    # Fast path for the common case of a prompt with a single user message
+    if (
+        len(message_params) == 1
+        and type(message_param := message_params[0]) is BaseMessageParam
+        and message_param.role == "user"
+        and isinstance(content := message_param.content, str)
+    ):
+        return [UserMessage(content=content)]
     converted_message_params = []
     for message_param in message_params:
         if not isinstance(message_param, BaseMessageParam):
             converted_message_params.append(message_param)
         elif isinstance(content := message_param.content, str):
-            converted_message_params.append(_make_message(**message_param.model_dump()))
+            converted_message_params.append(
+                _make_message(role=message_param.role, content=content)
+            )
         else:
             converted_content = []
             for part in content:
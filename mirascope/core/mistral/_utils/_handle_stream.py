@@ -78,12 +78,12 @@ def handle_stream(
         if not tool_types or not chunk.data.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
-                    MistralCallResponseChunk(chunk=chunk.data),
+                    MistralCallResponseChunk.model_construct(chunk=chunk.data),
                     current_tool_type.from_tool_call(current_tool_call),
                 )
                 current_tool_type = None
             else:
-                yield MistralCallResponseChunk(chunk=chunk.data), None
+                yield MistralCallResponseChunk.model_construct(chunk=chunk.data), None
         tool, current_tool_call, current_tool_type = _handle_chunk(
             chunk,
             current_tool_call,
@@ -91,12 +91,12 @@ def handle_stream(
             tool_types,
         )
         if tool is not None:
-            yield MistralCallResponseChunk(chunk=chunk.data), tool
+            yield MistralCallResponseChunk.model_construct(chunk=chunk.data), tool
         else:
             last_chuk_data = chunk.data
     if current_tool_type and last_chuk_data:
         yield (
-            MistralCallResponseChunk(chunk=last_chuk_data),
+            MistralCallResponseChunk.model_construct(chunk=last_chuk_data),
             current_tool_type.from_tool_call(current_tool_call),
         )
 
@@ -116,12 +116,12 @@ async def handle_stream_async(
         if not tool_types or not chunk.data.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
-                    MistralCallResponseChunk(chunk=chunk.data),
+                    MistralCallResponseChunk.model_construct(chunk=chunk.data),
                     current_tool_type.from_tool_call(current_tool_call),
                 )
                 current_tool_type = None
             else:
-                yield MistralCallResponseChunk(chunk=chunk.data), None
+                yield MistralCallResponseChunk.model_construct(chunk=chunk.data), None
         tool, current_tool_call, current_tool_type = _handle_chunk(
             chunk,
             current_tool_call,
@@ -129,11 +129,11 @@ async def handle_stream_async(
             tool_types,
         )
         if tool is not None:
-            yield MistralCallResponseChunk(chunk=chunk.data), tool
+            yield MistralCallResponseChunk.model_construct(chunk=chunk.data), tool
         else:
             last_chuk_data = chunk.data
     if current_tool_type and last_chuk_data:
         yield (
-            MistralCallResponseChunk(chunk=last_chuk_data),
+            MistralCallResponseChunk.model_construct(chunk=last_chuk_data),
             current_tool_type.from_tool_call(current_tool_call),
         )
@@ -5,6 +5,7 @@ from collections.abc import (
     Awaitable,
     Callable,
 )
+from functools import lru_cache
 from typing import Any, cast, overload
 
 from mistralai import Mistral
@@ -21,7 +22,6 @@ from mistralai.models import (
 )
 from pydantic import BaseModel
 
-from ... import BaseMessageParam
 from ...base import BaseTool, _utils
 from ...base._utils import (
     AsyncCreateFn,
@@ -40,6 +40,12 @@ from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
 
+@lru_cache(maxsize=4)
+def _default_client(api_key: str) -> Mistral:
+    """Returns a shared `Mistral` client so that calls reuse its connection pool."""
+    return Mistral(api_key=api_key)
+
+
 @overload
 def setup_call(
     *,
@@ -113,38 +119,34 @@ def setup_call(
         call_params,
         convert_common_call_params,
     )
-    call_kwargs = cast(MistralCallKwargs, base_call_kwargs)
-    messages = cast(
-        list[
-            BaseMessageParam
-            | AssistantMessage
-            | SystemMessage
-            | ToolMessage
-            | UserMessage
-        ],
-        messages,
-    )
+    call_kwargs: MistralCallKwargs = base_call_kwargs  # pyright: ignore [reportAssignmentType]
     messages = convert_message_params(messages)
     if json_mode:
         if not tools:
             call_kwargs["response_format"] = ResponseFormat(type="json_object")
-        json_mode_content = _utils.json_mode_content(
-            tool_types[0] if tool_types else None
-        )
-        if messages[-1].role == "user":
-            if isinstance(messages[-1].content, list):
-                messages[-1].content.append(TextChunk(text=json_mode_content))
-            elif isinstance(messages[-1].content, str):
-                messages[-1].content += json_mode_content
-        else:
-            messages.append(UserMessage(content=json_mode_content.strip()))
+        tool_type = tool_types[0] if tool_types else None
+        json_mode_content = _utils.json_mode_content(tool_type)
+        if (last_message := messages[-1]).role != "user":
+            messages.append(
+                UserMessage(content=_utils.json_mode_content(tool_type, strip=True))
+            )
+        elif isinstance(content := last_message.content, list):
+            messages[-1] = UserMessage(
+                content=[*content, TextChunk(text=json_mode_content)]
+            )
+        elif isinstance(content, str):
+            messages[-1] = UserMessage(content=content + json_mode_content)
     elif response_model:
         assert tool_types, "At least one tool must be provided for extraction."
         call_kwargs["tool_choice"] = cast(ToolChoiceEnum, "any")
-    call_kwargs |= {"model": model, "messages": messages}
+    call_kwargs["model"] = model
+    call_kwargs["messages"] = messages
 
     if client is None:
-        client = Mistral(api_key=os.environ["MISTRAL_API_KEY"])
+        api_key = os.environ["MISTRAL_API_KEY"]
+        client = (
+            Mistral(api_key=api_key) if fn_is_async(fn) else _default_client(api_key)
+        )
     if fn_is_async(fn):
         create_or_stream = get_async_create_fn(
             client.chat.complete_async, client.chat.stream_async
@@ -90,12 +90,12 @@ def handle_stream(
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
-                    OpenAICallResponseChunk(chunk=chunk),
+                    OpenAICallResponseChunk.model_construct(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
                 )
                 current_tool_type = None
             else:
-                yield OpenAICallResponseChunk(chunk=chunk), None
+                yield OpenAICallResponseChunk.model_construct(chunk=chunk), None
         tool, current_tool_call, current_tool_type = _handle_chunk(
             chunk,
             current_tool_call,
@@ -104,7 +104,7 @@ def handle_stream(
             partial_tools,
         )
         if tool is not None:
-            yield OpenAICallResponseChunk(chunk=chunk), tool
+            yield OpenAICallResponseChunk.model_construct(chunk=chunk), tool
 
 
 async def handle_stream_async(
@@ -121,12 +121,12 @@ async def handle_stream_async(
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
                 yield (
-                    OpenAICallResponseChunk(chunk=chunk),
+                    OpenAICallResponseChunk.model_construct(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
                 )
                 current_tool_type = None
             else:
-                yield OpenAICallResponseChunk(chunk=chunk), None
+                yield OpenAICallResponseChunk.model_construct(chunk=chunk), None
         tool, current_tool_call, current_tool_type = _handle_chunk(
             chunk,
             current_tool_call,
@@ -135,4 +135,4 @@ async def handle_stream_async(
             partial_tools,
         )
         if tool is not None:
-            yield OpenAICallResponseChunk(chunk=chunk), tool
+            yield OpenAICallResponseChunk.model_construct(chunk=chunk), tool
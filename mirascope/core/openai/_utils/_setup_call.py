@@ -1,9 +1,11 @@
 """This module contains the setup_call function for OpenAI tools."""
 
 import inspect
+import os
 import warnings
 from collections.abc import Awaitable, Callable
-from typing import Any, cast, overload
+from functools import lru_cache
+from typing import Any, overload
 
 from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
 from openai.types.chat import (
@@ -14,7 +16,7 @@ from openai.types.chat import (
 )
 from pydantic import BaseModel
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseTool, _utils
 from ...base._utils import (
     DEFAULT_TOOL_DOCSTRING,
     AsyncCreateFn,
@@ -32,6 +34,19 @@ from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
 
+@lru_cache(maxsize=4)
+def _default_client(
+    api_key: str | None,
+    organization: str | None,
+    project: str | None,
+    base_url: str | None,
+) -> OpenAI:
+    """Returns a shared `OpenAI` client so that calls reuse its connection pool."""
+    return OpenAI(
+        api_key=api_key, organization=organization, project=project, base_url=base_url
+    )
+
+
 @overload
 def setup_call(
     *,
@@ -106,8 +121,7 @@ def setup_call(
         call_params,
         convert_common_call_params,
     )
-    call_kwargs = cast(OpenAICallKwargs, base_call_kwargs)
-    messages = cast(list[BaseMessageParam | ChatCompletionMessageParam], messages)
+    call_kwargs: OpenAICallKwargs = base_call_kwargs  # pyright: ignore [reportAssignmentType]
     messages = convert_message_params(messages)
     if json_mode:
         if response_model and response_model.model_config.get("strict", False):
@@ -124,7 +138,7 @@ def setup_call(
             }
         else:
             call_kwargs["response_format"] = {"type": "json_object"}
-            json_mode_content = _utils.json_mode_content(response_model).strip()
+            json_mode_content = _utils.json_mode_content(response_model, strip=True)
             messages.append(
                 ChatCompletionUserMessageParam(role="user", content=json_mode_content)
             )
@@ -143,10 +157,20 @@ def setup_call(
             if "stream_options" not in call_kwargs
             else call_kwargs["stream_options"].update({"include_usage": True})  # pyright: ignore [reportOptionalMemberAccess]
         )
-    call_kwargs |= {"model": model, "messages": messages}
+    call_kwargs["model"] = model
+    call_kwargs["messages"] = messages
 
     if client is None:
-        client = AsyncOpenAI() if inspect.iscoroutinefunction(fn) else OpenAI()
+        client = (
+            AsyncOpenAI()
+            if inspect.iscoroutinefunction(fn)
+            else _default_client(
+                api_key=os.environ.get("OPENAI_API_KEY"),
+                organization=os.environ.get("OPENAI_ORG_ID"),
+                project=os.environ.get("OPENAI_PROJECT_ID"),
+                base_url=os.environ.get("OPENAI_BASE_URL"),
+            )
+        )
     create = (
         get_async_create_fn(client.chat.completions.create)
         if isinstance(client, AsyncOpenAI)
@@ -17,7 +17,7 @@ def handle_stream(
     Note: vertex does not currently support streaming tools.
     """
     for chunk in stream:
-        yield VertexCallResponseChunk(chunk=chunk), None
+        yield VertexCallResponseChunk.model_construct(chunk=chunk), None
 
 
 async def handle_stream_async(
@@ -30,4 +30,4 @@ async def handle_stream_async(
     Note: vertex does not currently support streaming tools.
     """
     async for chunk in stream:
-        yield VertexCallResponseChunk(chunk=chunk), None
+        yield VertexCallResponseChunk.model_construct(chunk=chunk), None
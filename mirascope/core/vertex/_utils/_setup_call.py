@@ -14,7 +14,7 @@ from vertexai.generative_models import (
     ToolConfig,
 )
 
-from ...base import BaseMessageParam, BaseTool, _utils
+from ...base import BaseTool, _utils
 from ...base._utils import (
     AsyncCreateFn,
     CreateFn,
@@ -105,8 +105,7 @@ def setup_call(
         call_params,
         convert_common_call_params,
     )
-    call_kwargs = cast(VertexCallKwargs, base_call_kwargs)
-    messages = cast(list[BaseMessageParam | Content], messages)
+    call_kwargs: VertexCallKwargs = base_call_kwargs  # pyright: ignore [reportAssignmentType]
     messages = convert_message_params(messages)
     if json_mode:
         generation_config = call_kwargs.get(
@@ -131,7 +130,7 @@ def setup_call(
             )
         )
         call_kwargs["tool_config"] = tool_config
-    call_kwargs |= {"contents": messages}
+    call_kwargs["contents"] = messages
 
     if client is None:
         client = GenerativeModel(model_name=model)
@@ -8,10 +8,16 @@ from anthropic import Anthropic
 from pydantic import BaseModel
 
 from mirascope.core.anthropic._utils import convert_common_call_params
-from mirascope.core.anthropic._utils._setup_call import setup_call
+from mirascope.core.anthropic._utils._setup_call import _default_client, setup_call
 from mirascope.core.anthropic.tool import AnthropicTool
 
 
+@pytest.fixture(autouse=True)
+def clear_default_client() -> None:
+    """Clears the shared default client so each test constructs its own."""
+    _default_client.cache_clear()
+
+
 @pytest.fixture()
 def mock_base_setup_call() -> MagicMock:
     """Returns the mock setup_call function."""
@@ -68,6 +74,60 @@ def test_setup_call(
     assert inspect.signature(create) == inspect.signature(Anthropic().messages.create)
 
 
+@patch("mirascope.core.anthropic._utils._setup_call.Anthropic", new_callable=MagicMock)
+@patch(
+    "mirascope.core.anthropic._utils._setup_call.convert_message_params",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.anthropic._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_reuses_default_client(
+    mock_utils: MagicMock,
+    mock_convert_message_params: MagicMock,
+    mock_anthropic: MagicMock,
+    mock_base_setup_call: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that sync calls without a client share the default client."""
+    monkeypatch.delenv("ANTHROPIC_AUTH_TOKEN", raising=False)
+    monkeypatch.delenv("ANTHROPIC_BASE_URL", raising=False)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    mock_utils.setup_call = mock_base_setup_call
+    mock_base_setup_call.return_value[3] = {"max_tokens": 1000}
+    for _ in range(2):
+        setup_call(
+            model="claude-3-5-sonnet-20240620",
+            client=None,
+            fn=MagicMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={"max_tokens": 1000},
+            response_model=None,
+            stream=False,
+        )
+    mock_anthropic.assert_called_once_with(
+        api_key="test", auth_token=None, base_url=None
+    )
+
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", "https://example.com")
+    setup_call(
+        model="claude-3-5-sonnet-20240620",
+        client=None,
+        fn=MagicMock(),
+        fn_args={},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={"max_tokens": 1000},
+        response_model=None,
+        stream=False,
+    )
+    mock_anthropic.assert_called_with(
+        api_key="test", auth_token=None, base_url="https://example.com"
+    )
+
+
 @patch("mirascope.core.anthropic._utils._setup_call._utils", new_callable=MagicMock)
 def test_setup_call_system_message(
     mock_utils: MagicMock, mock_base_setup_call: MagicMock
@@ -106,9 +166,8 @@ def test_setup_call_json_mode(
     """Tests the `setup_call` function with JSON mode."""
     mock_utils.setup_call = mock_base_setup_call
     mock_utils.json_mode_content = MagicMock()
-    mock_base_setup_call.return_value[1] = [
-        {"role": "user", "content": [{"type": "text", "text": "test"}]}
-    ]
+    last_message = {"role": "user", "content": [{"type": "text", "text": "test"}]}
+    mock_base_setup_call.return_value[1] = [last_message]
     mock_base_setup_call.return_value[3] = {"max_tokens": 1000, "tools": MagicMock()}
     mock_convert_message_params.side_effect = lambda x: x
     _, _, messages, _, call_kwargs = setup_call(
@@ -128,9 +187,14 @@ def test_setup_call_json_mode(
         "text": mock_utils.json_mode_content.return_value,
     }
     assert "tools" in call_kwargs
+    assert last_message == {
+        "role": "user",
+        "content": [{"type": "text", "text": "test"}],
+    }
 
     mock_utils.json_mode_content.return_value = "\n\njson"
-    mock_base_setup_call.return_value[1] = [{"role": "user", "content": "test"}]
+    last_message = {"role": "user", "content": "test"}
+    mock_base_setup_call.return_value[1] = [last_message]
     _, _, messages, _, call_kwargs = setup_call(
         model="claude-3-5-sonnet-20240620",
         client=None,
@@ -144,6 +208,7 @@ def test_setup_call_json_mode(
         stream=False,
     )
     assert messages[-1]["content"] == "test\n\njson"  # type: ignore
+    assert last_message == {"role": "user", "content": "test"}
 
 
 @patch(
@@ -87,8 +87,9 @@ def test_setup_call_json_mode(
 ) -> None:
     """Tests the `setup_call` function with JSON mode."""
     mock_utils.setup_call = mock_base_setup_call
-    mock_utils.json_mode_content = MagicMock()
-    mock_utils.json_mode_content.return_value = "\n\njson output"
+    mock_utils.json_mode_content = MagicMock(
+        side_effect=lambda _, strip=False: "json output" if strip else "\n\njson output"
+    )
     mock_base_setup_call.return_value[1] = [
         {"role": "user", "content": [{"type": "text", "text": "test"}]}
     ]
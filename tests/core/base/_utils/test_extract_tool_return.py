@@ -1,8 +1,10 @@
 """Tests the `_utils.extract_tool_return` module."""
 
+from datetime import date
 from typing import Annotated
 
-from pydantic import BaseModel, RootModel
+import pytest
+from pydantic import BaseModel, ConfigDict, RootModel, ValidationError
 
 from mirascope.core.base._utils._extract_tool_return import extract_tool_return
 from mirascope.core.base.from_call_args import FromCallArgs
@@ -48,6 +50,43 @@ def test_extract_tool_return_base_type() -> None:
     assert title == "The Name"
 
 
+def test_extract_tool_return_json_string() -> None:
+    """Tests that complete JSON strings are validated directly as JSON."""
+
+    class Book(BaseModel):
+        model_config = ConfigDict(strict=True)
+
+        title: str
+        published: date
+
+    book = extract_tool_return(
+        Book,
+        '{"title": "The Name of the Wind", "published": "2007-03-27"}',
+        allow_partial=False,
+        fields_from_call_args={},
+    )
+    assert book == Book(title="The Name of the Wind", published=date(2007, 3, 27))
+
+    count = extract_tool_return(
+        int, '{"value": 3}', allow_partial=False, fields_from_call_args={}
+    )
+    assert count == 3
+
+
+@pytest.mark.parametrize("response_model", [str, RootModel[list[str]]])
+def test_extract_tool_return_malformed_json(response_model: type) -> None:
+    """Tests that malformed JSON strings raise a `ValidationError`."""
+    with pytest.raises(ValidationError) as exc_info:
+        extract_tool_return(
+            response_model,
+            '{"value": "The Name',
+            allow_partial=False,
+            fields_from_call_args={},
+        )
+    assert isinstance(exc_info.value, ValueError)
+    assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+
 def test_extract_tool_return_parse_obj_with_fields_from_call_args() -> None:
     """Tests the `extract_tool_return` function parsing obj and fields from call args."""
 
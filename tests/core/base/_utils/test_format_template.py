@@ -2,7 +2,10 @@
 
 from unittest.mock import MagicMock, patch
 
-from mirascope.core.base._utils._format_template import format_template
+from mirascope.core.base._utils._format_template import (
+    _parse_template,
+    format_template,
+)
 
 
 @patch(
@@ -17,6 +20,7 @@ def test_format_template(
     mock_get_template_variables: MagicMock, mock_get_template_values: MagicMock
 ) -> None:
     """Tests the `format_template` function."""
+    _parse_template.cache_clear()
     mock_get_template_variables.return_value = [("genre", None)]
     attrs = {"genre": "fantasy"}
     mock_get_template_values.return_value = attrs
@@ -29,7 +33,11 @@ def test_format_template(
     mock_get_template_variables.assert_called_once_with(
         "Recommend a {genre} book.", True
     )
-    mock_get_template_values.assert_called_once_with([("genre", None)], attrs)
+    mock_get_template_values.assert_called_once_with((("genre", None),), attrs)
+
+    # The parsed template is cached, so the variables aren't parsed again.
+    assert format_template(template, attrs) == "Recommend a fantasy book."
+    mock_get_template_variables.assert_called_once()
 
 
 def test_format_template_with_none_attrs() -> None:
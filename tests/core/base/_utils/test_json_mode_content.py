@@ -31,3 +31,6 @@ For your final response, output ONLY a valid JSON dict (NOT THE SCHEMA) from the
   "type": "object"
 }"""
     )
+    assert json_mode_content(Book) is json_mode_content(Book)
+    assert json_mode_content(Book, strip=True) == json_mode_content(Book).strip()
+    assert json_mode_content(None, strip=True) == json_mode_content(None).strip()
@@ -307,3 +307,77 @@ def test_setup_call_with_empty_common_params() -> None:
     ]
     assert tool_types is None
     assert call_kwargs == {}
+
+
+def test_setup_call_caches_common_params_conversion() -> None:
+    """Tests that identical CommonCallParams are only converted once.
+
+    Unhashable values (e.g. a list of `stop` sequences) skip the cache and are
+    converted on every call.
+    """
+    conversions = []
+
+    def convert_common_call_params(params: CommonCallParams) -> BaseCallParams:
+        """Test conversion function that records each conversion."""
+        conversions.append(params)
+        return cast(BaseCallParams, {"converted": dict(params)})
+
+    @prompt_template("Recommend a {genre} book.")
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    for common_params in [
+        {"temperature": 0.3, "seed": 42},
+        {"seed": 42, "temperature": 0.3},
+        {"temperature": 0.3, "stop": ["\n"]},
+        {"temperature": 0.3, "stop": ["\n"]},
+    ]:
+        _, _, _, call_kwargs = setup_call(
+            fn,
+            {"genre": "fantasy"},
+            None,
+            None,
+            BaseTool,
+            cast(CommonCallParams, common_params),
+            convert_common_call_params,  # pyright: ignore [reportArgumentType]
+        )
+        assert call_kwargs == {"converted": common_params}
+
+    assert len(conversions) == 3
+
+
+def test_setup_call_caches_tool_conversion() -> None:
+    """Tests that tools are only converted into tool types once."""
+
+    class Tool(BaseTool):
+        @classmethod
+        def tool_schema(cls) -> dict:
+            return {"name": cls._name()}
+
+    def format_book(title: str) -> str:
+        """Returns the formatted book.
+
+        Args:
+            title: The title of the book.
+        """
+        return title  # pragma: no cover
+
+    @prompt_template("Recommend a {genre} book.")
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    def get_tool_types() -> list[type[Tool]]:
+        _, _, tool_types, call_kwargs = setup_call(
+            fn,
+            {"genre": "fantasy"},
+            None,
+            [format_book],
+            Tool,
+            {},
+            lambda params: cast(BaseCallParams, params),  # pyright: ignore [reportArgumentType]
+        )
+        assert tool_types is not None
+        assert call_kwargs == {"tools": [{"name": "format_book"}]}
+        return tool_types
+
+    tool_types = get_tool_types()
+    assert tool_types[0]._name() == "format_book"
+    assert get_tool_types()[0] is tool_types[0]
@@ -0,0 +1,216 @@
+"""Tests the `cache` module."""
+
+from typing import cast
+from unittest.mock import MagicMock
+
+import pytest
+from anthropic import Anthropic
+from anthropic.types import Message, TextBlock, Usage
+from openai import OpenAI
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+
+from mirascope.core import anthropic, cache, openai
+from mirascope.core.base import BaseStream, InMemoryStore
+
+
+def test_in_memory_store() -> None:
+    """Tests the `InMemoryStore` class evicts the least recently used value."""
+    store = InMemoryStore(maxsize=2)
+    assert store.get("a") is None
+    store.set("a", 1)
+    store.set("b", 2)
+    assert store.get("a") == 1
+    store.set("c", 3)
+    assert store.get("b") is None
+    assert store.get("a") == 1
+    assert store.get("c") == 3
+
+
+def test_cache() -> None:
+    """Tests the `cache` decorator reuses outputs for identical arguments."""
+    calls = []
+
+    @cache()
+    def recommend_book(genre: str, *, topic: str = "dragons") -> str:
+        calls.append((genre, topic))
+        return f"{genre} book about {topic}"
+
+    assert recommend_book("fantasy") == "fantasy book about dragons"
+    assert recommend_book(genre="fantasy") == "fantasy book about dragons"
+    assert recommend_book("fantasy", topic="elves") == "fantasy book about elves"
+    assert recommend_book("mystery") == "mystery book about dragons"
+    assert calls == [
+        ("fantasy", "dragons"),
+        ("fantasy", "elves"),
+        ("mystery", "dragons"),
+    ]
+    assert recommend_book.__name__ == "recommend_book"
+
+
+def test_cache_unserializable_args() -> None:
+    """Tests that calls with arguments that can't be serialized are never cached."""
+
+    class Doc:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+    calls = []
+
+    @cache()
+    def summarize(doc: Doc) -> str:
+        calls.append(doc.text)
+        return f"summary of {doc.text}"
+
+    assert summarize(Doc("alpha")) == "summary of alpha"
+    assert summarize(Doc("beta")) == "summary of beta"
+    assert summarize(Doc("alpha")) == "summary of alpha"
+    assert calls == ["alpha", "beta", "alpha"]
+
+
+def test_cache_shared_store() -> None:
+    """Tests that different calls sharing a store don't share outputs."""
+    store = InMemoryStore()
+
+    @cache(store)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    @cache(store)
+    def recommend_author(genre: str) -> str:
+        return f"Recommend a {genre} author"
+
+    assert recommend_book("fantasy") == "Recommend a fantasy book"
+    assert recommend_author("fantasy") == "Recommend a fantasy author"
+    assert len(store._values) == 2
+
+
+def test_cache_skips_streams() -> None:
+    """Tests that streams are never cached."""
+    fn = MagicMock(__name__="stream", __qualname__="stream", __module__=__name__)
+    fn.side_effect = lambda: MagicMock(spec=BaseStream)
+
+    cached_fn = cache()(fn)
+    assert cached_fn() is not cached_fn()
+    assert fn.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_async() -> None:
+    """Tests the `cache` decorator with an async function."""
+    calls = []
+
+    @cache()
+    async def recommend_book(genre: str) -> str:
+        calls.append(genre)
+        return f"Recommend a {genre} book"
+
+    assert await recommend_book("fantasy") == "Recommend a fantasy book"
+    assert await recommend_book("fantasy") == "Recommend a fantasy book"
+    assert calls == ["fantasy"]
+
+
+def test_cache_provider_calls_shared_store() -> None:
+    """Tests that different provider calls on one prompt never share outputs."""
+    openai_client = MagicMock()
+    openai_client.base_url = "https://api.openai.com/v1/"
+    openai_client.chat.completions.create.return_value = ChatCompletion(
+        id="id",
+        choices=[
+            Choice(
+                finish_reason="stop",
+                index=0,
+                message=ChatCompletionMessage(content="openai", role="assistant"),
+            )
+        ],
+        created=0,
+        model="gpt-4o-mini",
+        object="chat.completion",
+    )
+    anthropic_client = MagicMock()
+    anthropic_client.base_url = "https://api.anthropic.com"
+    anthropic_client.messages.create.return_value = Message(
+        id="id",
+        content=[TextBlock(text="anthropic", type="text")],
+        model="claude-3-5-sonnet-20240620",
+        role="assistant",
+        stop_reason="end_turn",
+        stop_sequence=None,
+        type="message",
+        usage=Usage(input_tokens=1, output_tokens=1),
+    )
+
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    store = InMemoryStore()
+    recommend_book_openai = cache(store)(
+        openai.call("gpt-4o-mini", client=cast(OpenAI, openai_client))(recommend_book)
+    )
+    recommend_book_openai_hot = cache(store)(
+        openai.call(
+            "gpt-4o-mini",
+            client=cast(OpenAI, openai_client),
+            call_params={"temperature": 1.5},
+        )(recommend_book)
+    )
+    recommend_book_openai_json = cache(store)(
+        openai.call("gpt-4o-mini", client=cast(OpenAI, openai_client), json_mode=True)(
+            recommend_book
+        )
+    )
+    recommend_book_anthropic = cache(store)(
+        anthropic.call(
+            "claude-3-5-sonnet-20240620", client=cast(Anthropic, anthropic_client)
+        )(recommend_book)
+    )
+
+    for _ in range(2):
+        assert recommend_book_openai("fantasy").content == "openai"
+        assert recommend_book_openai_hot("fantasy").content == "openai"
+        assert recommend_book_openai_json("fantasy").content == "openai"
+        assert recommend_book_anthropic("fantasy").content == "anthropic"
+    assert openai_client.chat.completions.create.call_count == 3
+    assert anthropic_client.messages.create.call_count == 1
+    assert len(store._values) == 4
+
+
+def test_cache_provider_calls_different_clients() -> None:
+    """Tests that calls to different endpoints never share outputs."""
+
+    def mock_client(base_url: str) -> MagicMock:
+        client = MagicMock()
+        client.base_url = base_url
+        client.chat.completions.create.return_value = ChatCompletion(
+            id="id",
+            choices=[
+                Choice(
+                    finish_reason="stop",
+                    index=0,
+                    message=ChatCompletionMessage(content=base_url, role="assistant"),
+                )
+            ],
+            created=0,
+            model="gpt-4o-mini",
+            object="chat.completion",
+        )
+        return client
+
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    store = InMemoryStore()
+    openai_client = mock_client("https://api.openai.com/v1/")
+    local_client = mock_client("http://localhost:8000/v1/")
+    recommend_book_openai = cache(store)(
+        openai.call("gpt-4o-mini", client=cast(OpenAI, openai_client))(recommend_book)
+    )
+    recommend_book_local = cache(store)(
+        openai.call("gpt-4o-mini", client=cast(OpenAI, local_client))(recommend_book)
+    )
+
+    for _ in range(2):
+        assert recommend_book_openai("fantasy").content == "https://api.openai.com/v1/"
+        assert recommend_book_local("fantasy").content == "http://localhost:8000/v1/"
+    assert openai_client.chat.completions.create.call_count == 1
+    assert local_client.chat.completions.create.call_count == 1
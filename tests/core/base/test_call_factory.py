@@ -171,7 +171,18 @@ def test_call_factory_structured_stream(
         get_json_output=mock_call_factory_kwargs["get_json_output"],
     )
     mock_partial.assert_called_once_with(
-        mock_structured_stream_factory.return_value, **structured_stream_kwargs
+        mock_structured_stream_factory.return_value,
+        **structured_stream_kwargs,
+        batch_size=1,
+    )
+    mock_partial.reset_mock()
+    _ = call(
+        stream={"partial_tools": False, "batch_size": 5}, **structured_stream_kwargs
+    )
+    mock_partial.assert_called_once_with(
+        mock_structured_stream_factory.return_value,
+        **structured_stream_kwargs,
+        batch_size=5,
     )
 
 
@@ -184,3 +195,26 @@ def test_call_decorator_invalid_output_parser_with_stream(
         ValueError, match="Cannot use `output_parser` with `stream=True`"
     ):
         call("model", stream=True, output_parser=MagicMock())
+
+
+def test_call_decorator_invalid_batch_size(mock_call_factory_kwargs: dict) -> None:
+    """Tests a ValueError is raised if the stream `batch_size` is less than 1."""
+    call = call_factory(**mock_call_factory_kwargs)
+    with pytest.raises(ValueError, match="The stream `batch_size` must be at least 1"):
+        call(
+            "model",
+            stream={"partial_tools": False, "batch_size": 0},
+            response_model=MagicMock,
+        )
+
+
+def test_call_decorator_batch_size_without_response_model(
+    mock_call_factory_kwargs: dict,
+) -> None:
+    """Tests a ValueError is raised if the stream `batch_size` has no response model."""
+    call = call_factory(**mock_call_factory_kwargs)
+    with pytest.raises(
+        ValueError,
+        match="The stream `batch_size` can only be used with `response_model`",
+    ):
+        call("model", stream={"partial_tools": False, "batch_size": 10})
@@ -208,3 +208,41 @@ async def test_base_structured_stream(mock_extract_tool_return: MagicMock) -> No
         )
         mock_extract_tool_return.reset_mock()
         i += 1
+
+
+@patch(
+    "mirascope.core.base.structured_stream.extract_tool_return", new_callable=MagicMock
+)
+@pytest.mark.asyncio
+async def test_base_structured_stream_batch_size(
+    mock_extract_tool_return: MagicMock,
+) -> None:
+    """Tests that partial outputs are only extracted every `batch_size` chunks."""
+    chunks = []
+    for content in ['{"title": ', '"The ', "Name of ", 'the Wind"}']:
+        chunk = MagicMock()
+        chunk.content = content
+        chunks.append((chunk, None))
+
+    base_stream = MagicMock()
+    base_stream.__iter__.return_value = iter(chunks)
+
+    async def generator(self):
+        for chunk in chunks:
+            yield chunk
+
+    base_stream.__aiter__ = generator
+    structured_stream = BaseStructuredStream(
+        stream=base_stream,
+        response_model=MagicMock,
+        fields_from_call_args={},
+        batch_size=3,
+    )
+    assert len(list(structured_stream)) == 2
+    assert [call.args for call in mock_extract_tool_return.call_args_list] == [
+        (MagicMock, '{"title": "The Name of ', True, {}),
+        (MagicMock, '{"title": "The Name of the Wind"}', False, {}),
+    ]
+    mock_extract_tool_return.reset_mock()
+    assert len([output async for output in structured_stream]) == 2
+    assert mock_extract_tool_return.call_count == 2
@@ -10,6 +10,7 @@ from mirascope.core.bedrock._utils._convert_common_call_params import (
     convert_common_call_params,
 )
 from mirascope.core.bedrock._utils._setup_call import (
+    _default_client,
     _extract_async_stream_fn,
     _extract_sync_stream_fn,
     _get_async_client,
@@ -18,6 +19,12 @@ from mirascope.core.bedrock._utils._setup_call import (
 from mirascope.core.bedrock.tool import BedrockTool
 
 
+@pytest.fixture(autouse=True)
+def clear_default_client() -> None:
+    """Clears the shared default client so each test constructs its own."""
+    _default_client.cache_clear()
+
+
 @pytest.fixture()
 def mock_base_setup_call() -> MagicMock:
     mock_setup_call = MagicMock()
@@ -123,6 +130,38 @@ def test_setup_call(
     assert messages == mock_convert_message_params.return_value
 
 
+@patch("mirascope.core.bedrock._utils._setup_call.Session", new_callable=MagicMock)
+@patch(
+    "mirascope.core.bedrock._utils._setup_call.convert_message_params",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.bedrock._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_reuses_default_client(
+    mock_utils: MagicMock,
+    mock_convert_message_params: MagicMock,
+    mock_session: MagicMock,
+    mock_base_setup_call: MagicMock,
+) -> None:
+    """Tests that sync calls without a client share the default client."""
+    mock_utils.setup_call = mock_base_setup_call
+    mock_base_setup_call.return_value[3] = {}
+    for _ in range(2):
+        setup_call(
+            model="anthropic.claude-v2",
+            client=None,
+            fn=MagicMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={},
+            response_model=None,
+            stream=False,
+        )
+    mock_session.assert_called_once_with()
+    mock_session.return_value.client.assert_called_once_with("bedrock-runtime")
+
+
 @patch("mirascope.core.bedrock._utils._setup_call._utils", new_callable=MagicMock)
 def test_setup_call_system_message(
     mock_utils: MagicMock, mock_base_setup_call: MagicMock
@@ -161,9 +200,8 @@ def test_setup_call_json_mode(
 ) -> None:
     mock_utils.setup_call = mock_base_setup_call
     mock_utils.json_mode_content = MagicMock(return_value="json_content")
-    mock_base_setup_call.return_value[1] = [
-        {"role": "user", "content": [{"text": "test"}]}
-    ]
+    last_message = {"role": "user", "content": [{"text": "test"}]}
+    mock_base_setup_call.return_value[1] = [last_message]
     mock_base_setup_call.return_value[3] = {"tools": MagicMock()}
     mock_convert_message_params.side_effect = lambda x: x
     _, _, messages, _, call_kwargs = setup_call(
@@ -179,6 +217,7 @@ def test_setup_call_json_mode(
         stream=False,
     )
     assert messages[-1]["content"] == [{"text": "testjson_content"}]
+    assert last_message == {"role": "user", "content": [{"text": "test"}]}
     assert "tools" not in call_kwargs
 
 
@@ -1,5 +1,6 @@
 """Tests the `gemini._utils.setup_call` module."""
 
+from copy import deepcopy
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -80,6 +81,7 @@ def test_setup_call(
     mock_generate_content.assert_called_once_with(**call_kwargs)
 
 
+@pytest.mark.parametrize("parts", [["test"], [{"type": "text", "text": "test"}]])
 @pytest.mark.parametrize("generation_config_type", [dict, GenerationConfig])
 @patch(
     "mirascope.core.gemini._utils._setup_call.convert_message_params",
@@ -91,13 +93,14 @@ def test_setup_call_json_mode(
     mock_convert_message_params: MagicMock,
     mock_base_setup_call: MagicMock,
     generation_config_type: type,
+    parts: list,
 ) -> None:
     """Tests the `setup_call` function with JSON mode."""
     mock_utils.setup_call = mock_base_setup_call
     mock_utils.json_mode_content = MagicMock()
-    mock_base_setup_call.return_value[1] = [
-        {"role": "user", "parts": [{"type": "text", "text": "test"}]}
-    ]
+    last_message = {"role": "user", "parts": parts}
+    original_last_message = deepcopy(last_message)
+    mock_base_setup_call.return_value[1] = [last_message]
     mock_base_setup_call.return_value[-1]["tools"] = MagicMock()
     mock_base_setup_call.return_value[-1]["generation_config"] = generation_config_type(
         candidate_count=1,
@@ -123,6 +126,7 @@ def test_setup_call_json_mode(
         stream=False,
     )
     assert messages[-1]["parts"][-1] == mock_utils.json_mode_content.return_value
+    assert last_message == original_last_message
     assert "tools" in call_kwargs
     assert "generation_config" in call_kwargs
     assert call_kwargs["generation_config"] == {
@@ -78,3 +78,10 @@ def test_convert_message_params() -> None:
                 )
             ]
         )
+
+
+def test_convert_message_params_single_user_message() -> None:
+    """Tests the `convert_message_params` function with a single user message."""
+    assert convert_message_params([BaseMessageParam(role="user", content="Hello")]) == [
+        {"role": "user", "content": "Hello"}
+    ]
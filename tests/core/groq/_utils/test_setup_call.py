@@ -9,10 +9,16 @@ from pydantic import BaseModel
 from mirascope.core.groq._utils._convert_common_call_params import (
     convert_common_call_params,
 )
-from mirascope.core.groq._utils._setup_call import setup_call
+from mirascope.core.groq._utils._setup_call import _default_client, setup_call
 from mirascope.core.groq.tool import GroqTool
 
 
+@pytest.fixture(autouse=True)
+def clear_default_client() -> None:
+    """Clears the shared default client so each test constructs its own."""
+    _default_client.cache_clear()
+
+
 @pytest.fixture()
 def mock_base_setup_call() -> MagicMock:
     """Returns the mock setup_call function."""
@@ -70,6 +76,54 @@ def test_setup_call(
     mock_create.assert_called_once_with(**call_kwargs)
 
 
+@patch("mirascope.core.groq._utils._setup_call.Groq", new_callable=MagicMock)
+@patch(
+    "mirascope.core.groq._utils._setup_call.convert_message_params",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.groq._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_reuses_default_client(
+    mock_utils: MagicMock,
+    mock_convert_message_params: MagicMock,
+    mock_groq: MagicMock,
+    mock_base_setup_call: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that sync calls without a client share the default client."""
+    monkeypatch.delenv("GROQ_BASE_URL", raising=False)
+    monkeypatch.setenv("GROQ_API_KEY", "test")
+    mock_utils.setup_call = mock_base_setup_call
+    for _ in range(2):
+        setup_call(
+            model="llama-3.1-8b-instant",
+            client=None,
+            fn=MagicMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={},
+            response_model=None,
+            stream=False,
+        )
+    mock_groq.assert_called_once_with(api_key="test", base_url=None)
+
+    monkeypatch.setenv("GROQ_BASE_URL", "https://example.com")
+    setup_call(
+        model="llama-3.1-8b-instant",
+        client=None,
+        fn=MagicMock(),
+        fn_args={},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={},
+        response_model=None,
+        stream=False,
+    )
+    mock_groq.assert_called_with(api_key="test", base_url="https://example.com")
+
+
 @patch(
     "mirascope.core.groq._utils._setup_call.convert_message_params",
     new_callable=MagicMock,
@@ -82,10 +136,12 @@ def test_setup_call_json_mode(
 ) -> None:
     """Tests the `setup_call` function with JSON mode."""
     mock_utils.setup_call = mock_base_setup_call
-    mock_json_mode_content = MagicMock()
-    mock_json_mode_content.return_value = "\n\njson_output"
+    mock_json_mode_content = MagicMock(
+        side_effect=lambda _, strip=False: "json_output" if strip else "\n\njson_output"
+    )
     mock_utils.json_mode_content = mock_json_mode_content
-    mock_base_setup_call.return_value[1] = [{"role": "user", "content": "test"}]
+    last_message = {"role": "user", "content": "test"}
+    mock_base_setup_call.return_value[1] = [last_message]
     mock_base_setup_call.return_value[-1]["tools"] = MagicMock()
     mock_convert_message_params.side_effect = lambda x: x
     _, _, messages, _, call_kwargs = setup_call(
@@ -105,6 +161,28 @@ def test_setup_call_json_mode(
         "content": "test\n\njson_output",
     }
     assert "tools" in call_kwargs
+    assert last_message == {"role": "user", "content": "test"}
+
+    mock_base_setup_call.return_value[1] = [
+        {"role": "user", "content": "test", "name": "alice"}
+    ]
+    _, _, messages, _, call_kwargs = setup_call(
+        model="llama-3.1-8b-instant",
+        client=None,
+        fn=MagicMock(),
+        fn_args={},
+        dynamic_config=None,
+        tools=None,
+        json_mode=True,
+        call_params={},
+        response_model=None,
+        stream=False,
+    )
+    assert messages[-1] == {
+        "role": "user",
+        "content": "test\n\njson_output",
+        "name": "alice",
+    }
 
     mock_base_setup_call.return_value[1] = [
         {"role": "user", "content": [{"type": "text", "text": "test"}]}
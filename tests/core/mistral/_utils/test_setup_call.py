@@ -16,10 +16,16 @@ from pydantic import BaseModel
 from mirascope.core.mistral._utils._convert_common_call_params import (
     convert_common_call_params,
 )
-from mirascope.core.mistral._utils._setup_call import setup_call
+from mirascope.core.mistral._utils._setup_call import _default_client, setup_call
 from mirascope.core.mistral.tool import MistralTool
 
 
+@pytest.fixture(autouse=True)
+def clear_default_client() -> None:
+    """Clears the shared default client so each test constructs its own."""
+    _default_client.cache_clear()
+
+
 @pytest.fixture()
 def mock_base_setup_call() -> MagicMock:
     """Returns the mock setup_call function."""
@@ -80,6 +86,38 @@ def test_setup_call(
     assert next(stream) == "chat"  # pyright: ignore [reportArgumentType]
 
 
+@patch("mirascope.core.mistral._utils._setup_call.Mistral", new_callable=MagicMock)
+@patch(
+    "mirascope.core.mistral._utils._setup_call.convert_message_params",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.mistral._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_reuses_default_client(
+    mock_utils: MagicMock,
+    mock_convert_message_params: MagicMock,
+    mock_mistral: MagicMock,
+    mock_base_setup_call: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that sync calls without a client share the default client."""
+    monkeypatch.setenv("MISTRAL_API_KEY", "test")
+    mock_utils.setup_call = mock_base_setup_call
+    for _ in range(2):
+        setup_call(
+            model="mistral-large-latest",
+            client=None,
+            fn=MagicMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={},
+            response_model=None,
+            stream=False,
+        )
+    mock_mistral.assert_called_once_with(api_key="test")
+
+
 @patch(
     "mirascope.core.mistral._utils._setup_call.convert_message_params",
     new_callable=MagicMock,
@@ -199,12 +237,17 @@ def test_setup_call_json_mode(
     """
     # Setup mocks
     mock_utils.setup_call = mock_base_setup_call
-    mock_json_mode_content = MagicMock()
-    mock_json_mode_content.return_value = "\n\njson_mode_content"
+    mock_json_mode_content = MagicMock(
+        side_effect=lambda _, strip=False: (
+            "json_mode_content" if strip else "\n\njson_mode_content"
+        )
+    )
     mock_utils.json_mode_content = mock_json_mode_content
     mock_base_setup_call.return_value[1] = base_messages
     mock_base_setup_call.return_value[-1]["tools"] = MagicMock()
     mock_convert_message_params.side_effect = lambda x: x
+    last_base_message = base_messages[-1]
+    original_last_base_message = last_base_message.model_copy(deep=True)
 
     # Execute setup_call
     _, _, messages, _, call_kwargs = setup_call(
@@ -222,6 +265,7 @@ def test_setup_call_json_mode(
 
     # Verify results
     assert messages[-1] == expected_last_message
+    assert last_base_message == original_last_base_message
     assert "tools" in call_kwargs
 
 
@@ -10,10 +10,16 @@ from mirascope.core.base import ResponseModelConfigDict
 from mirascope.core.openai._utils._convert_common_call_params import (
     convert_common_call_params,
 )
-from mirascope.core.openai._utils._setup_call import setup_call
+from mirascope.core.openai._utils._setup_call import _default_client, setup_call
 from mirascope.core.openai.tool import OpenAITool
 
 
+@pytest.fixture(autouse=True)
+def clear_default_client() -> None:
+    """Clears the shared default client so each test constructs its own."""
+    _default_client.cache_clear()
+
+
 @pytest.fixture()
 def mock_base_setup_call() -> MagicMock:
     """Returns the mock setup_call function."""
@@ -67,6 +73,60 @@ def test_setup_call(
     mock_create.reset_mock()
 
 
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+@patch(
+    "mirascope.core.openai._utils._setup_call.convert_message_params",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.openai._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_reuses_default_client(
+    mock_utils: MagicMock,
+    mock_convert_message_params: MagicMock,
+    mock_openai: MagicMock,
+    mock_base_setup_call: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that sync calls without a client share the default client."""
+    monkeypatch.delenv("OPENAI_ORG_ID", raising=False)
+    monkeypatch.delenv("OPENAI_PROJECT_ID", raising=False)
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    mock_utils.setup_call = mock_base_setup_call
+    for _ in range(2):
+        setup_call(
+            model="gpt-4o",
+            client=None,
+            fn=MagicMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={},
+            response_model=None,
+            stream=False,
+        )
+    mock_openai.assert_called_once_with(
+        api_key="test", organization=None, project=None, base_url=None
+    )
+
+    monkeypatch.setenv("OPENAI_BASE_URL", "https://example.com")
+    setup_call(
+        model="gpt-4o",
+        client=None,
+        fn=MagicMock(),
+        fn_args={},
+        dynamic_config=None,
+        tools=None,
+        json_mode=False,
+        call_params={},
+        response_model=None,
+        stream=False,
+    )
+    mock_openai.assert_called_with(
+        api_key="test", organization=None, project=None, base_url="https://example.com"
+    )
+
+
 @patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
 @patch(
     "mirascope.core.openai._utils._setup_call.convert_message_params",
@@ -125,8 +185,9 @@ def test_setup_call_json_mode(
 ) -> None:
     """Tests the `setup_call` function with JSON mode."""
     mock_utils.setup_call = mock_base_setup_call
-    mock_utils.json_mode_content = MagicMock()
-    mock_utils.json_mode_content.return_value = "\n\njson output"
+    mock_utils.json_mode_content = MagicMock(
+        side_effect=lambda _, strip=False: "json output" if strip else "\n\njson output"
+    )
     mock_base_setup_call.return_value[1] = [
         {"role": "user", "content": [{"type": "text", "text": "test"}]}
     ]
@@ -0,0 +1,68 @@
+"""Tests the lazy provider imports of the `mirascope.core` module."""
+
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import mirascope.core
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    """Runs `code` in a fresh interpreter so that no modules are already imported."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+
+
+def test_import_does_not_import_providers() -> None:
+    """Tests that importing `mirascope.core` imports no provider SDKs."""
+    result = _run(
+        "import sys\n"
+        "import mirascope.core\n"
+        "sdks = ['anthropic', 'groq', 'mistralai', 'openai']\n"
+        "print(sorted(sdk for sdk in sdks if sdk in sys.modules))\n"
+        "print('mirascope.core.openai' in sys.modules)\n"
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == ["[]", "False"]
+
+
+def test_getattr_imports_provider(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that accessing a provider imports and caches its module."""
+    monkeypatch.delitem(vars(mirascope.core), "openai", raising=False)
+    assert mirascope.core.openai is import_module("mirascope.core.openai")
+    assert vars(mirascope.core)["openai"] is mirascope.core.openai
+
+
+def test_getattr_unknown_attribute() -> None:
+    """Tests that accessing an unknown attribute raises an `AttributeError`."""
+    with pytest.raises(
+        AttributeError, match="module 'mirascope.core' has no attribute 'unknown'"
+    ):
+        mirascope.core.unknown  # pyright: ignore [reportAttributeAccessIssue]  # noqa: B018
+
+
+def test_getattr_missing_sdk() -> None:
+    """Tests that a provider whose SDK is not installed is a missing attribute."""
+    result = _run(
+        "import sys\n"
+        "sys.modules['openai'] = None\n"
+        "import mirascope.core\n"
+        "try:\n"
+        "    mirascope.core.openai\n"
+        "except AttributeError as e:\n"
+        "    print(type(e).__name__, e)\n"
+        "try:\n"
+        "    from mirascope.core import openai\n"
+        "except ImportError as e:\n"
+        "    print(type(e).__name__)\n"
+        "print(mirascope.core.anthropic.__name__)\n"
+    )
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert lines[0].startswith(
+        "AttributeError module 'mirascope.core' has no attribute 'openai'"
+    )
+    assert lines[1:] == ["ModuleNotFoundError", "mirascope.core.anthropic"]
@@ -1,6 +1,8 @@
+from collections.abc import Generator
 from contextlib import suppress
 from functools import cached_property
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from pydantic import BaseModel, Field
@@ -8,7 +10,6 @@ from pydantic import BaseModel, Field
 from mirascope.core.base.call_response import BaseCallResponse
 from mirascope.core.base.metadata import Metadata
 from mirascope.core.base.stream import BaseStream
-from mirascope.core.base.structured_stream import BaseStructuredStream
 from mirascope.core.base.tool import BaseTool
 from mirascope.integrations.logfire import _utils
 
@@ -23,6 +24,24 @@ class FormatBook(BaseTool):
         return f"{self.title} by {self.author}"  # pragma: no cover
 
 
+_FORMAT_BOOK = FormatBook(title="The Name of the Wind", author="Rothfuss, Patrick")
+
+_BASE_KWARGS: dict[str, Any] = {
+    "metadata": {"tags": {"version:0001"}},
+    "response": "test response",
+    "tool_types": [],
+    "prompt_template": "test prompt",
+    "fn_args": {},
+    "dynamic_config": {},
+    "messages": [],
+    "call_params": {},
+    "call_kwargs": {},
+    "user_message_param": {},
+    "start_time": 100,
+    "end_time": 200,
+}
+
+
 class MyCallResponse(BaseCallResponse):
     @property
     def content(self) -> str:
@@ -30,17 +49,24 @@ class MyCallResponse(BaseCallResponse):
 
     @cached_property
     def tools(self) -> list[BaseTool]:
-        return [FormatBook(title="The Name of the Wind", author="Rothfuss, Patrick")]
+        return [_FORMAT_BOOK]
 
 
-patch.multiple(MyCallResponse, __abstractmethods__=set()).start()
-patch.multiple(BaseStream, __abstractmethods__=set()).start()
+@pytest.fixture(scope="module", autouse=True)
+def allow_abstract() -> Generator[None, None, None]:
+    """Lets `MyCallResponse` and `BaseStream` be instantiated in this module."""
+    saved = {cls: cls.__abstractmethods__ for cls in (MyCallResponse, BaseStream)}
+    for cls in saved:
+        cls.__abstractmethods__ = frozenset()
+    yield
+    for cls, abstract_methods in saved.items():
+        cls.__abstractmethods__ = abstract_methods
 
 
 @patch("logfire.with_settings", new_callable=MagicMock)
 def test_logfire_custom_context_manager(mock_logfire: MagicMock) -> None:
     """Tests the `custom_context_manager` context manager."""
-    mock_fn = MagicMock()
+    mock_fn = Mock()
     mock_fn.__name__ = "mock_fn"
     mock_fn._metadata = Metadata(tags={"tag1", "tag2"})
 
@@ -53,7 +79,7 @@ def test_logfire_custom_context_manager(mock_logfire: MagicMock) -> None:
 
 
 def test_get_call_response_span_data() -> None:
-    call_response = MagicMock()
+    call_response = Mock()
     result = _utils._get_call_response_span_data(call_response)
     assert result["async"] is False
     assert result["call_params"] == call_response.call_params
@@ -72,21 +98,21 @@ def test_get_call_response_span_data() -> None:
     }
 
 
-def test_get_tool_calls() -> None:
-    call_response = MyCallResponse(
-        metadata={"tags": {"version:0001"}},
-        response="test response",
-        tool_types=[],
-        prompt_template="test prompt",
-        fn_args={},
-        dynamic_config={},
-        messages=[],
-        call_params={},
-        call_kwargs={},
-        user_message_param={},
-        start_time=100,
-        end_time=200,
-    )  # type: ignore
+def _build_response() -> MyCallResponse:
+    """Returns a `MyCallResponse` built without validation from known-valid data.
+
+    The nested values of `_BASE_KWARGS` are shared, so tests must not mutate them.
+    """
+    return MyCallResponse.model_construct(**_BASE_KWARGS)
+
+
+@pytest.fixture(scope="module")
+def call_response() -> MyCallResponse:
+    """Returns a `MyCallResponse` shared by the tests in this module."""
+    return _build_response()
+
+
+def test_get_tool_calls(call_response: MyCallResponse) -> None:
     result = _utils._get_tool_calls(call_response)
     assert result == [
         {
@@ -100,82 +126,68 @@ def test_get_tool_calls() -> None:
         }
     ]
 
-    result = MagicMock()
+    result = Mock()
     result.tools = None
     assert _utils._get_tool_calls(result) is None
 
 
-@patch(
-    "mirascope.integrations.logfire._utils._get_call_response_span_data",
-    new_callable=MagicMock,
-    return_value={},
-)
-@patch("mirascope.integrations.logfire._utils._get_tool_calls", new_callable=MagicMock)
-def test_handle_call_response(
-    mock_get_tool_calls: MagicMock,
-    mock_get_call_response_span_data: MagicMock,
-) -> None:
-    mock_fn = MagicMock()
-    assert _utils.handle_call_response(MagicMock(), mock_fn, None) is None
-
-    result = MagicMock()
-    result.tools = [
-        FormatBook(title="The Name of the Wind", author="Rothfuss, Patrick")
-    ]
-    span = MagicMock()
-    set_attributes = MagicMock()
+def test_handle_call_response(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_get_call_response_span_data = Mock(return_value={})
+    mock_get_tool_calls = Mock()
+    monkeypatch.setattr(
+        _utils, "_get_call_response_span_data", mock_get_call_response_span_data
+    )
+    monkeypatch.setattr(_utils, "_get_tool_calls", mock_get_tool_calls)
+    mock_fn = Mock()
+    assert _utils.handle_call_response(Mock(), mock_fn, None) is None
+
+    result = Mock()
+    result.tools = [_FORMAT_BOOK]
+    span = Mock()
+    set_attributes = Mock()
     span.set_attributes = set_attributes
     mock_get_call_response_span_data.return_value = {"output": {}}
     _utils.handle_call_response(result, mock_fn, span)
-    assert set_attributes.call_count == 1
     mock_get_tool_calls.assert_called_once_with(result)
     mock_get_call_response_span_data.assert_called_once_with(result)
     assert mock_get_call_response_span_data.return_value["async"] is False
-    assert (
-        set_attributes.call_args[0][0] == mock_get_call_response_span_data.return_value
+    set_attributes.assert_called_once_with(
+        mock_get_call_response_span_data.return_value
     )
 
 
-@patch(
-    "mirascope.integrations.logfire._utils._get_call_response_span_data",
-    new_callable=MagicMock,
-    return_value={},
-)
-@patch("mirascope.integrations.logfire._utils._get_tool_calls", new_callable=MagicMock)
-@pytest.mark.asyncio
-async def test_handle_call_response_async(
-    mock_get_tool_calls: MagicMock,
-    mock_get_call_response_span_data: MagicMock,
-) -> None:
-    mock_fn = MagicMock()
-    assert await _utils.handle_call_response_async(MagicMock(), mock_fn, None) is None
-
-    result = MagicMock()
-    result.tools = [
-        FormatBook(title="The Name of the Wind", author="Rothfuss, Patrick")
-    ]
-    span = MagicMock()
-    set_attributes = MagicMock()
+async def test_handle_call_response_async(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_get_call_response_span_data = Mock(return_value={})
+    mock_get_tool_calls = Mock()
+    monkeypatch.setattr(
+        _utils, "_get_call_response_span_data", mock_get_call_response_span_data
+    )
+    monkeypatch.setattr(_utils, "_get_tool_calls", mock_get_tool_calls)
+    mock_fn = Mock()
+    assert await _utils.handle_call_response_async(Mock(), mock_fn, None) is None
+
+    result = Mock()
+    result.tools = [_FORMAT_BOOK]
+    span = Mock()
+    set_attributes = Mock()
     span.set_attributes = set_attributes
     mock_get_call_response_span_data.return_value = {"output": {}}
     await _utils.handle_call_response_async(result, mock_fn, span)
-    assert set_attributes.call_count == 1
     mock_get_tool_calls.assert_called_once_with(result)
     mock_get_call_response_span_data.assert_called_once_with(result)
     assert mock_get_call_response_span_data.return_value["async"] is True
-    assert (
-        set_attributes.call_args[0][0] == mock_get_call_response_span_data.return_value
+    set_attributes.assert_called_once_with(
+        mock_get_call_response_span_data.return_value
     )
 
 
-@patch(
-    "mirascope.integrations.logfire._utils.handle_call_response", new_callable=MagicMock
-)
-def test_handle_stream(mock_handle_call_response: MagicMock) -> None:
-    mock_fn = MagicMock()
-    mock_stream = MagicMock(spec=BaseStream)
-    construct_call_response = MagicMock()
-    mock_span = MagicMock()
+def test_handle_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_handle_call_response = Mock()
+    monkeypatch.setattr(_utils, "handle_call_response", mock_handle_call_response)
+    mock_fn = Mock()
+    mock_stream = Mock()
+    construct_call_response = Mock()
+    mock_span = Mock()
     mock_stream.construct_call_response.return_value = construct_call_response
     _utils.handle_stream(mock_stream, mock_fn, mock_span)
     mock_handle_call_response.assert_called_once_with(
@@ -183,16 +195,15 @@ def test_handle_stream(mock_handle_call_response: MagicMock) -> None:
     )
 
 
-@patch(
-    "mirascope.integrations.logfire._utils.handle_call_response_async",
-    new_callable=AsyncMock,
-)
-@pytest.mark.asyncio
-async def test_handle_stream_async(mock_handle_call_response_async: MagicMock) -> None:
-    mock_fn = MagicMock()
-    mock_stream = MagicMock(spec=BaseStream)
-    construct_call_response = MagicMock()
-    mock_span = MagicMock()
+async def test_handle_stream_async(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_handle_call_response_async = AsyncMock()
+    monkeypatch.setattr(
+        _utils, "handle_call_response_async", mock_handle_call_response_async
+    )
+    mock_fn = Mock()
+    mock_stream = Mock()
+    construct_call_response = Mock()
+    mock_span = Mock()
     mock_stream.construct_call_response.return_value = construct_call_response
     await _utils.handle_stream_async(mock_stream, mock_fn, mock_span)
     mock_handle_call_response_async.assert_called_once_with(
@@ -200,60 +211,59 @@ async def test_handle_stream_async(mock_handle_call_response_async: MagicMock) -
     )
 
 
-@patch(
-    "mirascope.integrations.logfire._utils._get_call_response_span_data",
-    new_callable=MagicMock,
-    return_value={},
-)
-@patch(
-    "mirascope.integrations.logfire._utils._set_response_model_output",
-    new_callable=MagicMock,
-    return_value={},
-)
-def test_handle_response_model(
-    mock_set_response_model_output: MagicMock,
-    mock_get_call_response_span_data: MagicMock,
+@pytest.mark.parametrize("is_async", [False, True])
+async def test_handle_response_model(
+    is_async: bool, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    mock_fn = MagicMock()
-    assert _utils.handle_response_model(MagicMock(), mock_fn, None) is None
-
-    base_model_result = MagicMock(spec=BaseModel)
-    base_model_result._response = MagicMock(spec=BaseCallResponse)
-    span = MagicMock()
-    mock_output = MagicMock()
-    mock_set_attributes = MagicMock()
+    mock_get_call_response_span_data = Mock(return_value={})
+    mock_set_response_model_output = Mock(return_value={})
+    monkeypatch.setattr(
+        _utils, "_get_call_response_span_data", mock_get_call_response_span_data
+    )
+    monkeypatch.setattr(
+        _utils, "_set_response_model_output", mock_set_response_model_output
+    )
+
+    async def handle_response_model(*args: Any) -> None:
+        if is_async:
+            return await _utils.handle_response_model_async(*args)
+        return _utils.handle_response_model(*args)
+
+    mock_fn = Mock()
+    assert await handle_response_model(Mock(), mock_fn, None) is None
+
+    class MyBaseModel(BaseModel): ...
+
+    base_model_result = MyBaseModel()
+    base_model_result._response = Mock()  # pyright: ignore [reportAttributeAccessIssue]
+    span = Mock()
+    mock_output = Mock()
+    mock_set_attributes = Mock()
     span.set_attributes = mock_set_attributes
     mock_get_call_response_span_data.return_value = {"output": mock_output}
-    _utils.handle_response_model(base_model_result, mock_fn, span)
+    await handle_response_model(base_model_result, mock_fn, span)
     mock_get_call_response_span_data.assert_called_once_with(
-        base_model_result._response
+        base_model_result._response  # pyright: ignore [reportAttributeAccessIssue]
     )
     mock_set_response_model_output.assert_called_once_with(
         base_model_result, mock_get_call_response_span_data.return_value["output"]
     )
-    mock_set_attributes.assert_called_once_with({"output": mock_output, "async": False})
+    mock_set_attributes.assert_called_once_with(
+        {"output": mock_output, "async": is_async}
+    )
 
 
-@patch(
-    "mirascope.integrations.logfire._utils._get_structured_stream_span_data",
-    new_callable=MagicMock,
-    return_value={},
-)
-def test_handle_structured_stream(
-    mock_get_structured_stream_span_data: MagicMock,
-) -> None:
-    mock_fn = MagicMock()
-    assert _utils.handle_structured_stream(MagicMock(), mock_fn, None) is None
+def test_handle_structured_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_get_structured_stream_span_data = Mock(return_value={})
+    monkeypatch.setattr(
+        _utils, "_get_structured_stream_span_data", mock_get_structured_stream_span_data
+    )
+    mock_fn = Mock()
+    assert _utils.handle_structured_stream(Mock(), mock_fn, None) is None
 
-    span = MagicMock()
+    span = Mock()
 
-    base_structured_stream_result = MagicMock(spec=BaseStructuredStream)
-    base_structured_stream_result.constructed_response_model = MagicMock(spec=BaseModel)
-    base_structured_stream_result.stream = MagicMock(spec=BaseStream)
-    base_call_response = MagicMock(spec=BaseCallResponse)
-    base_structured_stream_result.stream.construct_call_response.return_value = (
-        base_call_response
-    )
+    base_structured_stream_result = Mock()
     _utils.handle_structured_stream(base_structured_stream_result, mock_fn, span)
     mock_get_structured_stream_span_data.assert_called_once_with(
         base_structured_stream_result
@@ -261,79 +271,27 @@ def test_handle_structured_stream(
     assert mock_get_structured_stream_span_data.return_value["async"] is False
 
 
-@patch(
-    "mirascope.integrations.logfire._utils._get_error_span_data",
-    new_callable=MagicMock,
-    return_value={},
-)
-def test_handle_error(mock_get_error_span_data: MagicMock) -> None:
-    mock_get_error_span_data.return_value = {"error": "error"}
-    _utils.handle_error(Exception("error"), MagicMock(), None)
+def test_handle_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_get_error_span_data = Mock(return_value={"error": "error"})
+    monkeypatch.setattr(_utils, "_get_error_span_data", mock_get_error_span_data)
+    _utils.handle_error(Exception("error"), Mock(), None)
     assert mock_get_error_span_data.call_count == 0
-    span = MagicMock()
+    span = Mock()
     with suppress(Exception):
-        _utils.handle_error(Exception("error"), MagicMock(), span)
-    assert span.set_attributes.call_count == 1
-    assert span.set_attributes.call_args[0][0] == {"error": "error", "async": False}
-
-
-@patch(
-    "mirascope.integrations.logfire._utils._get_call_response_span_data",
-    new_callable=MagicMock,
-    return_value={},
-)
-@patch(
-    "mirascope.integrations.logfire._utils._set_response_model_output",
-    new_callable=MagicMock,
-    return_value={},
-)
-@pytest.mark.asyncio
-async def test_handle_response_model_async(
-    mock_set_response_model_output: MagicMock,
-    mock_get_call_response_span_data: MagicMock,
-) -> None:
-    mock_fn = MagicMock()
-    assert await _utils.handle_response_model_async(MagicMock(), mock_fn, None) is None
+        _utils.handle_error(Exception("error"), Mock(), span)
+    span.set_attributes.assert_called_once_with({"error": "error", "async": False})
 
-    base_model_result = MagicMock(spec=BaseModel)
-    base_model_result._response = MagicMock(spec=BaseCallResponse)
-    span = MagicMock()
-    mock_set_attributes = MagicMock()
-    span.set_attributes = mock_set_attributes
-    mock_output = MagicMock()
-    mock_get_call_response_span_data.return_value = {"output": mock_output}
-    await _utils.handle_response_model_async(base_model_result, mock_fn, span)
-    mock_get_call_response_span_data.assert_called_once_with(
-        base_model_result._response
-    )
-    mock_set_response_model_output.assert_called_once_with(
-        base_model_result, mock_get_call_response_span_data.return_value["output"]
-    )
-    mock_set_attributes.assert_called_once_with({"output": mock_output, "async": True})
 
-
-@patch(
-    "mirascope.integrations.logfire._utils._get_structured_stream_span_data",
-    new_callable=MagicMock,
-    return_value={},
-)
-@pytest.mark.asyncio
-async def test_handle_structured_stream_async(
-    mock_get_structured_stream_span_data: MagicMock,
-) -> None:
-    mock_fn = MagicMock()
-    assert (
-        await _utils.handle_structured_stream_async(MagicMock(), mock_fn, None) is None
+async def test_handle_structured_stream_async(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_get_structured_stream_span_data = Mock(return_value={})
+    monkeypatch.setattr(
+        _utils, "_get_structured_stream_span_data", mock_get_structured_stream_span_data
     )
+    mock_fn = Mock()
+    assert await _utils.handle_structured_stream_async(Mock(), mock_fn, None) is None
 
-    span = MagicMock()
-    base_structured_stream_result = MagicMock(spec=BaseStructuredStream)
-    base_structured_stream_result.constructed_response_model = MagicMock(spec=BaseModel)
-    base_structured_stream_result.stream = MagicMock(spec=BaseStream)
-    base_call_response = MagicMock(spec=BaseCallResponse)
-    base_structured_stream_result.stream.construct_call_response.return_value = (
-        base_call_response
-    )
+    span = Mock()
+    base_structured_stream_result = Mock()
     await _utils.handle_structured_stream_async(
         base_structured_stream_result, mock_fn, span
     )
@@ -343,21 +301,15 @@ async def test_handle_structured_stream_async(
     assert mock_get_structured_stream_span_data.return_value["async"] is True
 
 
-@patch(
-    "mirascope.integrations.logfire._utils._get_error_span_data",
-    new_callable=MagicMock,
-    return_value={},
-)
-@pytest.mark.asyncio
-async def test_handle_error_async(mock_get_error_span_data: MagicMock) -> None:
-    mock_get_error_span_data.return_value = {"error": "error"}
-    await _utils.handle_error_async(Exception("error"), MagicMock(), None)
+async def test_handle_error_async(monkeypatch: pytest.MonkeyPatch) -> None:
+    mock_get_error_span_data = Mock(return_value={"error": "error"})
+    monkeypatch.setattr(_utils, "_get_error_span_data", mock_get_error_span_data)
+    await _utils.handle_error_async(Exception("error"), Mock(), None)
     assert mock_get_error_span_data.call_count == 0
-    span = MagicMock()
+    span = Mock()
     with suppress(Exception):
-        await _utils.handle_error_async(Exception("error"), MagicMock(), span)
-    assert span.set_attributes.call_count == 1
-    assert span.set_attributes.call_args[0][0] == {"error": "error", "async": True}
+        await _utils.handle_error_async(Exception("error"), Mock(), span)
+    span.set_attributes.assert_called_once_with({"error": "error", "async": True})
 
 
 def test_set_response_model_output() -> None:
@@ -385,8 +337,8 @@ def test_get_structured_stream_span_data_base_model(
     class MyBaseModel(BaseModel):
         foo: str
 
-    mock_result = MagicMock(spec=BaseStructuredStream)
-    mock_result.stream = MagicMock()
+    mock_result = Mock()
+    mock_result.stream = Mock()
     mock_result.constructed_response_model = MyBaseModel(foo="bar")
     span_data = _utils._get_structured_stream_span_data(mock_result)
     assert span_data == {
@@ -407,8 +359,8 @@ def test_get_structured_stream_span_data_base_type(
     class MyBaseModel(BaseModel):
         foo: str
 
-    mock_result = MagicMock(spec=BaseStructuredStream)
-    mock_result.stream = MagicMock()
+    mock_result = Mock()
+    mock_result.stream = Mock()
     mock_result.constructed_response_model = "foo"
     span_data = _utils._get_structured_stream_span_data(mock_result)
     assert span_data == {"output": {"content": "foo"}}
@@ -430,8 +382,8 @@ def test_get_error_span_data(
     mock_get_call_response_span_data.return_value = {"output": {"mock": "mock"}}
     mock_get_tool_calls.return_value = [{"function": "mock"}]
     error = Exception("error")
-    error._response = MagicMock()  # pyright: ignore [reportAttributeAccessIssue]
-    span_data = _utils._get_error_span_data(error, MagicMock())
+    error._response = Mock()  # pyright: ignore [reportAttributeAccessIssue]
+    span_data = _utils._get_error_span_data(error, Mock())
     assert span_data == {
         "output": {"mock": "mock", "tool_calls": [{"function": "mock"}]},
         "error": "Exception",
@@ -39,6 +39,8 @@ class MyCallResponse(BaseCallResponse):
 patch.multiple(MyCallResponse, __abstractmethods__=set()).start()
 patch.multiple(BaseStream, __abstractmethods__=set()).start()
 
+_USER_MSG = {"role": "user", "content": "user_content"}
+
 
 @patch("mirascope.integrations.otel._utils.get_tracer", new_callable=MagicMock)
 def test_custom_context_manager(mock_get_tracer: MagicMock) -> None:
@@ -158,7 +160,7 @@ def test_get_call_response_attributes() -> None:
 def test_set_call_response_event_attributes() -> None:
     """Tests the `_set_call_response_event_attributes` function."""
     result = MagicMock()
-    result.user_message_param = {"role": "user", "content": "user_content"}
+    result.user_message_param = _USER_MSG
     result.message_param = {"role": "assistant", "content": "assistant_content"}
     span = MagicMock()
     add_event = MagicMock()
@@ -327,7 +329,7 @@ def test_handle_response_model(
     result = MagicMock(spec=BaseModel)
     response = MagicMock()
     result._response = response
-    response.user_message_param = {"role": "user", "content": "user_content"}
+    response.user_message_param = _USER_MSG
     span = MagicMock()
     add_event = MagicMock()
     span.add_event = add_event
@@ -388,7 +390,7 @@ def test_handle_structured_stream(
     response = MagicMock()
     result.stream = response
     result.constructed_response_model = Foo(bar="baz")
-    response.user_message_param = {"role": "user", "content": "user_content"}
+    response.user_message_param = _USER_MSG
     mock_construct_call_response = MagicMock()
     response.construct_call_response = mock_construct_call_response
     span = MagicMock()
@@ -434,7 +436,7 @@ async def test_handle_response_model_async(
     result = MagicMock(spec=BaseModel)
     response = MagicMock()
     result._response = response
-    response.user_message_param = {"role": "user", "content": "user_content"}
+    response.user_message_param = _USER_MSG
     span = MagicMock()
     add_event = MagicMock()
     span.add_event = add_event
@@ -499,7 +501,7 @@ async def test_handle_structured_stream_async(
     response = MagicMock()
     result.stream = response
     result.constructed_response_model = Foo(bar="baz")
-    response.user_message_param = {"role": "user", "content": "user_content"}
+    response.user_message_param = _USER_MSG
     mock_construct_call_response = MagicMock()
     response.construct_call_response = mock_construct_call_response
     span = MagicMock()
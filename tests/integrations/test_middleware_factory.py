@@ -16,6 +16,21 @@ from mirascope.integrations._middleware_factory import (
 )
 
 
+class _StubResponseType:
+    """Placeholder `call_response_type` for streams that never construct a response."""
+
+
+@pytest.fixture(scope="module")
+def mock_chunk() -> MagicMock:
+    """Returns a stream chunk shared by the stream tests, which only read it."""
+    mock_chunk = MagicMock()
+    mock_chunk.content = "content"
+    mock_chunk.input_tokens = 1
+    mock_chunk.output_tokens = 2
+    mock_chunk.model = "updated_model"
+    return mock_chunk
+
+
 def test_default_context_manager() -> None:
     with default_context_manager(lambda x: x) as result:
         assert result is None
@@ -98,15 +113,9 @@ async def test_middleware_factory_call_response_async() -> None:
     assert result.content == call_response.content
 
 
-def test_middleware_factory_stream_sync() -> None:
+def test_middleware_factory_stream_sync(mock_chunk: MagicMock) -> None:
     patch.multiple(BaseStream, __abstractmethods__=set()).start()
 
-    mock_chunk = MagicMock()
-    mock_chunk.content = "content"
-    mock_chunk.input_tokens = 1
-    mock_chunk.output_tokens = 2
-    mock_chunk.model = "updated_model"
-
     class MyStream(BaseStream):
         @property
         def cost(self) -> int:
@@ -118,7 +127,7 @@ def test_middleware_factory_stream_sync() -> None:
         stream=(t for t in stream_chunks),
         metadata={},
         tool_types=[],
-        call_response_type=MagicMock,
+        call_response_type=_StubResponseType,
         model="model",
         prompt_template="prompt_template",
         fn_args={},
@@ -145,15 +154,9 @@ def test_middleware_factory_stream_sync() -> None:
 
 
 @pytest.mark.asyncio
-async def test_middleware_factory_stream_async() -> None:
+async def test_middleware_factory_stream_async(mock_chunk: MagicMock) -> None:
     patch.multiple(BaseStream, __abstractmethods__=set()).start()
 
-    mock_chunk = MagicMock()
-    mock_chunk.content = "content"
-    mock_chunk.input_tokens = 1
-    mock_chunk.output_tokens = 2
-    mock_chunk.model = "updated_model"
-
     class MyStream(BaseStream):
         @property
         def cost(self) -> int:
@@ -165,7 +168,7 @@ async def test_middleware_factory_stream_async() -> None:
         stream=(t for t in stream_chunks),
         metadata={},
         tool_types=[],
-        call_response_type=MagicMock,
+        call_response_type=_StubResponseType,
         model="model",
         prompt_template="prompt_template",
         fn_args={},
@@ -402,7 +405,7 @@ def test_middleware_factory_stream_sync_exception() -> None:
             stream=None,  # pyright: ignore [reportArgumentType]
             metadata={},
             tool_types=[],
-            call_response_type=MagicMock,
+            call_response_type=_StubResponseType,
             model="model",
             prompt_template="prompt_template",
             fn_args={},
@@ -456,7 +459,7 @@ async def test_middleware_factory_stream_async_exception() -> None:
             stream=None,  # pyright: ignore [reportArgumentType]
             metadata={},
             tool_types=[],
-            call_response_type=MagicMock,
+            call_response_type=_StubResponseType,
             model="model",
             prompt_template="prompt_template",
             fn_args={},
@@ -509,7 +512,7 @@ def test_middleware_factory_stream_sync_exception_no_handler() -> None:
             stream=None,  # pyright: ignore [reportArgumentType]
             metadata={},
             tool_types=[],
-            call_response_type=MagicMock,
+            call_response_type=_StubResponseType,
             model="model",
             prompt_template="prompt_template",
             fn_args={},
@@ -553,7 +556,7 @@ async def test_middleware_factory_stream_async_exception_no_handler() -> None:
             stream=None,  # pyright: ignore [reportArgumentType]
             metadata={},
             tool_types=[],
-            call_response_type=MagicMock,
+            call_response_type=_StubResponseType,
             model="model",
             prompt_template="prompt_template",
             fn_args={},
@@ -761,7 +764,7 @@ async def test_middleware_factory_stream_async_with_error() -> None:
             stream=None,  # pyright: ignore [reportArgumentType]
             metadata={},
             tool_types=[],
-            call_response_type=MagicMock,
+            call_response_type=_StubResponseType,
             model="model",
             prompt_template="prompt_template",
             fn_args={},
@@ -820,7 +823,7 @@ async def test_middleware_factory_stream_async_error_handling_fails() -> None:
             stream=None,  # pyright: ignore [reportArgumentType]
             metadata={},
             tool_types=[],
-            call_response_type=MagicMock,
+            call_response_type=_StubResponseType,
             model="model",
             prompt_template="prompt_template",
             fn_args={},
@@ -960,7 +963,7 @@ def test_stream_without_error_handler() -> None:
             stream=None,  # pyright: ignore [reportArgumentType]
             metadata={},
             tool_types=[],
-            call_response_type=MagicMock,
+            call_response_type=_StubResponseType,
             model="model",
             prompt_template="prompt_template",
             fn_args={},
@@ -1054,7 +1057,7 @@ async def test_middleware_factory_stream_error_handler_exception_async() -> None
             stream=None,  # pyright: ignore [reportArgumentType]
             metadata={},
             tool_types=[],
-            call_response_type=MagicMock,
+            call_response_type=_StubResponseType,
             model="model",
             prompt_template="prompt_template",
             fn_args={},
@@ -1169,7 +1172,7 @@ def test_middleware_factory_stream_error_handler_exception() -> None:
             stream=None,  # pyright: ignore [reportArgumentType]
             metadata={},
             tool_types=[],
-            call_response_type=MagicMock,
+            call_response_type=_StubResponseType,
             model="model",
             prompt_template="prompt_template",
             fn_args={},